@@ -1,6 +1,7 @@
 """HashChain - Sistema de criptografia por cadeias de substituição."""
 from .hashchain import HashChain
+from .core import EncryptResult, DecryptResult
 
-__all__ = ['HashChain']
+__all__ = ['HashChain', 'EncryptResult', 'DecryptResult']
 __version__ = '2.0.0'
 
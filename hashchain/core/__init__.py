@@ -1,8 +1,12 @@
 """Módulo core com funcionalidades principais de criptografia."""
-from .compression import Compression
+from .bitpacking import BitPacking
+from .compression import Compression, Compressor, Decompressor, DecompressionError
 from .encryption import Encryption
 from .decryption import Decryption
 from .key_generator import KeyGenerator
+from .results import EncryptResult, DecryptResult
+from .stream_encryption import StreamEncryptor
+from .stream_decryption import StreamDecryptor
 
-__all__ = ['Compression', 'Encryption', 'Decryption', 'KeyGenerator']
+__all__ = ['BitPacking', 'Compression', 'Compressor', 'Decompressor', 'DecompressionError', 'Encryption', 'Decryption', 'KeyGenerator', 'EncryptResult', 'DecryptResult', 'StreamEncryptor', 'StreamDecryptor']
 
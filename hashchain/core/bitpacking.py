@@ -0,0 +1,70 @@
+"""Módulo de empacotamento de texto binário em bytes."""
+from typing import Optional
+
+
+class BitPacking:
+    """Classe para empacotar texto binário ('0'/'1') em bytes, 8 bits por byte."""
+    
+    @staticmethod
+    def is_binary(text: str) -> bool:
+        """
+        Verifica se o texto contém apenas '0' e '1'.
+        
+        Args:
+            text: Texto a ser verificado
+        
+        Returns:
+            True se o texto for binário
+        """
+        return text.count("0") + text.count("1") == len(text)
+    
+    @staticmethod
+    def pack(bits: str) -> bytes:
+        """
+        Empacota texto binário em bytes (MSB primeiro).
+        
+        O último byte é completado com bits '0'; o número de bits válidos
+        não é guardado nos bytes e deve ser conhecido por quem desempacota.
+        
+        Args:
+            bits: Texto binário (apenas '0' e '1')
+        
+        Returns:
+            Bytes empacotados
+        
+        Raises:
+            ValueError: Se o texto contiver caracteres diferentes de '0' e '1'
+        """
+        if not BitPacking.is_binary(bits):
+            raise ValueError(
+                "Não foi possível empacotar o texto: apenas '0' e '1' são permitidos."
+            )
+        
+        if not bits:
+            return b""
+        
+        n_bytes = (len(bits) + 7) // 8
+        bits += "0" * (n_bytes * 8 - len(bits))
+        return int(bits, 2).to_bytes(n_bytes, "big")
+    
+    @staticmethod
+    def unpack(data: bytes, bit_length: Optional[int] = None) -> str:
+        """
+        Desempacota bytes em texto binário.
+        
+        Args:
+            data: Bytes empacotados
+            bit_length: Número de bits válidos (opcional, padrão todos os bits)
+        
+        Returns:
+            Texto binário
+        """
+        if not data:
+            return ""
+        
+        bits = bin(int.from_bytes(data, "big"))[2:].zfill(len(data) * 8)
+        
+        if bit_length is not None:
+            bits = bits[:bit_length]
+        
+        return bits
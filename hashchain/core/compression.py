@@ -1,5 +1,25 @@
 """Módulo de compressão e descompressão de texto binário."""
-from typing import Optional
+import base64
+import re
+import zlib
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import lzma
+    LZMA_AVAILABLE = True
+except ImportError:
+    LZMA_AVAILABLE = False
+
+from .bitpacking import BitPacking
+from .key_generator import KeyGenerator
+
+# Erros que os decodificadores de bytes dos codecs lançam para dados inválidos
+_CODEC_ERRORS = (ValueError, zlib.error) + ((lzma.LZMAError,) if LZMA_AVAILABLE else ())
+
+
+class DecompressionError(ValueError):
+    """Erro de descompressão: o texto comprimido contém caracteres inválidos."""
 
 
 class Compression:
@@ -18,6 +38,38 @@ class Compression:
         "9": "9",
     }
     
+    # Sequências de 3 ou mais bits iguais e tradução dos dígitos 0/1 da contagem
+    RUN_PATTERN = re.compile(r"0{3,}|1{3,}")
+    COUNT_TRANSLATION = str.maketrans("01", "ZX")
+    
+    # Tokens do texto comprimido: contagem seguida do bit repetido
+    COUNT_CHARS = "ZX23456789"
+    TOKEN_PATTERN = re.compile(r"([ZX2-9]+)([01])")
+    INVALID_PATTERN = re.compile(r"[^01ZX2-9]")
+    COUNT_DECODING = str.maketrans("ZX", "01")
+    
+    # Codecs de texto. O RLE não tem cabeçalho; os demais começam com
+    # [marcador][id do codec][bits de preenchimento], e o modo adaptativo com
+    # [marcador][id adaptativo] seguido dos blocos. O marcador não pertence a
+    # nenhum dos alfabetos, então basta o primeiro caractere para reconhecê-los.
+    CODEC_RLE = "rle"
+    CODEC_BASE64 = "base64"
+    CODEC_BASE85 = "base85"
+    CODEC_ZLIB = "zlib"
+    CODEC_LZMA = "lzma"
+    CODEC_ADAPTIVE = "adaptive"
+    PACKED_MARKER = "."
+    PACKED_HEADER_LENGTH = 3
+    ADAPTIVE_ID = "a"
+    
+    # Modo adaptativo: tamanho dos blocos (em bits) e política de escolha do codec
+    ADAPTIVE_BLOCK_BITS = 1 << 17
+    POLICY_SMALLEST = "smallest"  # todos os codecs, fica o menor resultado
+    POLICY_FASTEST = "fastest"  # apenas codecs rápidos, fica o menor resultado entre eles
+    
+    # Codecs registrados, por nome (ver register_codec)
+    CODECS: Dict[str, "TextCodec"] = {}
+    
     def __init__(self):
         """Inicializa o compressor."""
         pass
@@ -33,89 +85,624 @@ class Compression:
         Returns:
             Texto comprimido ou None se houver erro
         """
-        if not all(char in ["0", "1"] for char in cipher_text):
+        if cipher_text.count("0") + cipher_text.count("1") != len(cipher_text):
             print(
                 "Erro: Não foi possível comprimir o texto, caractere inválido no texto cifrado. "
                 "Apenas '0' e '1' são permitidos, verifique se o texto foi adulterado."
             )
             return None
         
-        pairs = []
-        consecutive = 0
-        last = ''
-        cipher_text += " "
-        
-        for char in cipher_text:
-            if not last:
-                last = char
-                consecutive += 1
-            elif char == last:
-                consecutive += 1
-            else:
-                pairs.append([consecutive, last])
-                last = char
-                consecutive = 1
-        
-        compressed = []
-        
-        for pair in pairs:
-            count, char = pair
-            if count == 1:
-                compressed.append(char)
-            elif count == 2:
-                compressed.append(char * 2)
-            elif 3 <= count <= 9:
-                compressed.append(self.TRANSLATION_DICT[str(count)] + char)
-            else:
-                count_str = str(count)
-                count_str = count_str.replace("0", "Z")
-                count_str = count_str.replace("1", "X")
-                compressed.append(count_str + char)
+        # Sequências de 1 ou 2 bits ficam como estão; as de 3 ou mais viram contagem + bit.
+        # Cada sequência distinta é convertida uma única vez por chamada.
+        replacements: Dict[str, str] = {}
+        
+        def replace_run(match: "re.Match[str]") -> str:
+            run = match[0]
+            code = replacements.get(run)
+            if code is None:
+                code = replacements[run] = self.encode_run(run[0], len(run))
+            return code
         
-        result = ''.join(compressed)
+        result = self.RUN_PATTERN.sub(replace_run, cipher_text)
         
         if print_output:
             print(result)
         
         return result
     
+    @classmethod
+    def encode_run(cls, bit: str, count: int) -> str:
+        """
+        Codifica uma sequência de count bits iguais, como em compress.
+        
+        Args:
+            bit: '0' ou '1'
+            count: Tamanho da sequência
+            
+        Returns:
+            Sequência comprimida
+        """
+        if count <= 2:
+            return bit * count
+        return str(count).translate(cls.COUNT_TRANSLATION) + bit
+    
+    @classmethod
+    def register_codec(cls, codec: "TextCodec") -> None:
+        """
+        Registra um codec de texto, tornando-o disponível em pack_text e no modo adaptativo.
+        
+        Args:
+            codec: Instância do codec (nome e id devem ser únicos)
+        
+        Raises:
+            ValueError: Se o id conflitar com outro codec ou com o id adaptativo
+        """
+        if len(codec.codec_id) != 1 or codec.codec_id == cls.ADAPTIVE_ID:
+            raise ValueError(f"Id de codec inválido: {codec.codec_id!r}")
+        for other in cls.CODECS.values():
+            if other.codec_id == codec.codec_id and other.name != codec.name:
+                raise ValueError(f"Id de codec já registrado: {codec.codec_id!r}")
+        cls.CODECS[codec.name] = codec
+    
+    @classmethod
+    def _codec_by_id(cls, codec_id: str) -> "TextCodec":
+        """Retorna o codec registrado com o id informado."""
+        for codec in cls.CODECS.values():
+            if codec.codec_id == codec_id:
+                return codec
+        raise DecompressionError(f"Erro: Codec de texto desconhecido ({codec_id}).")
+    
+    def pack_text(
+        self,
+        cipher_text: str,
+        codec: str = CODEC_BASE85,
+        policy: str = POLICY_SMALLEST,
+        block_bits: int = ADAPTIVE_BLOCK_BITS,
+    ) -> str:
+        """
+        Codifica texto binário com um codec registrado ou no modo adaptativo.
+        
+        Args:
+            cipher_text: Texto binário (apenas '0' e '1')
+            codec: Nome do codec registrado (ex: "base85", "zlib") ou "adaptive"
+            policy: Política do modo adaptativo: "smallest" ou "fastest"
+            block_bits: Tamanho dos blocos do modo adaptativo, em bits
+            
+        Returns:
+            Texto codificado (com cabeçalho, exceto no RLE)
+            
+        Raises:
+            ValueError: Se o codec ou a política forem desconhecidos ou o texto não for binário
+        """
+        if not BitPacking.is_binary(cipher_text):
+            raise ValueError(
+                "Não foi possível codificar o texto: apenas '0' e '1' são permitidos."
+            )
+        
+        if codec == self.CODEC_ADAPTIVE:
+            return self._pack_adaptive(cipher_text, policy, block_bits)
+        
+        if codec not in self.CODECS:
+            raise ValueError(f"Codec desconhecido: {codec}")
+        
+        if codec == self.CODEC_RLE:
+            return self.compress(cipher_text)
+        
+        text_codec = self.CODECS[codec]
+        fill = -len(cipher_text) % 8
+        
+        return self.PACKED_MARKER + text_codec.codec_id + str(fill) + text_codec.encode(cipher_text)
+    
+    def _pack_adaptive(self, cipher_text: str, policy: str, block_bits: int) -> str:
+        """
+        Codifica cada bloco com o codec que gera o menor resultado.
+        
+        Cada bloco é gravado como [id][#bits][#caracteres][dados], com os
+        inteiros precedidos pelo seu número de dígitos, como na chave.
+        """
+        if policy == self.POLICY_SMALLEST:
+            candidates = list(self.CODECS.values())
+        elif policy == self.POLICY_FASTEST:
+            candidates = [codec for codec in self.CODECS.values() if codec.fast]
+        else:
+            raise ValueError(f"Política desconhecida: {policy}")
+        
+        # Blocos múltiplos de 8 bits: só o último pode ter bits de preenchimento
+        block_bits = max(8, block_bits - block_bits % 8)
+        counted = KeyGenerator._counted
+        output = [self.PACKED_MARKER + self.ADAPTIVE_ID]
+        
+        for start in range(0, len(cipher_text), block_bits):
+            block = cipher_text[start:start + block_bits]
+            best_codec, best_payload = None, None
+            for codec in candidates:
+                payload = codec.encode(block)
+                if best_payload is None or len(payload) < len(best_payload):
+                    best_codec, best_payload = codec, payload
+            output.append(
+                best_codec.codec_id + counted(len(block)) + counted(len(best_payload)) + best_payload
+            )
+        
+        return "".join(output)
+    
+    def unpack_text(self, packed_text: str) -> str:
+        """
+        Decodifica texto gerado por pack_text (exceto RLE) de volta para texto binário.
+        
+        Args:
+            packed_text: Texto com cabeçalho de codec
+            
+        Returns:
+            Texto binário original
+            
+        Raises:
+            DecompressionError: Se o cabeçalho ou os dados forem inválidos
+        """
+        if packed_text[1:2] == self.ADAPTIVE_ID and self.is_packed_text(packed_text):
+            decoder = PackedTextDecoder()
+            return decoder.feed(packed_text) + decoder.flush()
+        
+        codec, fill = self._parse_packed_header(packed_text)
+        bits = codec.unpack(packed_text[self.PACKED_HEADER_LENGTH:])
+        
+        return bits[:len(bits) - fill]
+    
+    @classmethod
+    def is_packed_text(cls, text: str) -> bool:
+        """Indica se o texto foi gerado por pack_text com cabeçalho (pelo marcador inicial)."""
+        return text.startswith(cls.PACKED_MARKER)
+    
+    @classmethod
+    def _parse_packed_header(cls, text: str) -> Tuple["TextCodec", int]:
+        """
+        Lê o cabeçalho de um texto codificado com um único codec.
+        
+        Returns:
+            Tupla contendo (codec, bits_de_preenchimento)
+        """
+        if len(text) < cls.PACKED_HEADER_LENGTH or not cls.is_packed_text(text):
+            raise DecompressionError("Erro: Cabeçalho de texto empacotado ausente ou incompleto.")
+        
+        codec = cls._codec_by_id(text[1])
+        fill = text[2]
+        if fill not in "01234567":
+            raise DecompressionError("Erro: Cabeçalho de texto empacotado inválido.")
+        
+        return codec, int(fill)
+    
     def decompress(self, compressed_cipher_text: str, print_output: bool = False) -> str:
         """
         Descomprime texto binário comprimido.
         
+        Cada token é uma contagem opcional (Z, X e dígitos 2-9) seguida do bit
+        que ela repete; bits sem contagem são copiados como estão. Uma contagem
+        ao final, sem bit, é descartada.
+        
         Args:
             compressed_cipher_text: Texto comprimido
             print_output: Se True, imprime o resultado
             
         Returns:
-            Texto descomprimido ou mensagem de erro
-        """
-        valid_chars = ["0", "1", "Z", "X", "2", "3", "4", "5", "6", "7", "8", "9"]
-        for char in compressed_cipher_text:
-            if char not in valid_chars:
-                return (
-                    "Erro: Não foi possível descomprimir o texto, caractere inválido no texto comprimido. "
-                    "Apenas '0', '1', 'Z', 'X' e dígitos são permitidos, verifique se o texto foi adulterado."
-                )
-        
-        normalized = compressed_cipher_text
-        total: list[str] = []
-        aux: list[str] = []
-        
-        for c in normalized:
-            if c in ["0", "1"] and not aux:
-                total.append(c)
-            elif c in ["Z", "X", "2", "3", "4", "5", "6", "7", "8", "9"]:
-                aux.append(self.TRANSLATION_DICT[c])
-            else:
-                if aux:
-                    total.append(c * int("".join(aux)))
-                    aux = []
+            Texto descomprimido
+            
+        Raises:
+            DecompressionError: Se houver caractere inválido no texto comprimido
+        """
+        if self.INVALID_PATTERN.search(compressed_cipher_text):
+            raise DecompressionError(
+                "Erro: Não foi possível descomprimir o texto, caractere inválido no texto comprimido. "
+                "Apenas '0', '1', 'Z', 'X' e dígitos são permitidos, verifique se o texto foi adulterado."
+            )
+        
+        expansions: Dict[str, str] = {}
+        
+        def expand_run(match: "re.Match[str]") -> str:
+            token = match[0]
+            bits = expansions.get(token)
+            if bits is None:
+                count = match[1].translate(self.COUNT_DECODING)
+                bits = expansions[token] = match[2] * int(count)
+            return bits
         
-        result = "".join(total)
+        result = self.TOKEN_PATTERN.sub(expand_run, compressed_cipher_text.rstrip(self.COUNT_CHARS))
         
         if print_output:
             print("Decompressed text:\n" + result)
         
         return result
 
+
+class Compressor:
+    """
+    Compressor incremental: aceita o texto binário em partes.
+    
+    A sequência de bits iguais no fim de cada parte fica pendente (apenas bit
+    e contagem), pois pode continuar na parte seguinte. A saída concatenada
+    de feed() e flush() é idêntica a Compression.compress do texto inteiro.
+    """
+    
+    def __init__(self):
+        """Inicializa o compressor."""
+        self._compression = Compression()
+        self._run_bit = ""
+        self._run_len = 0
+    
+    def feed(self, chunk: str) -> str:
+        """
+        Comprime a próxima parte do texto binário.
+        
+        Args:
+            chunk: Próxima parte do texto binário
+            
+        Returns:
+            Texto comprimido das sequências já encerradas
+            
+        Raises:
+            ValueError: Se houver caractere diferente de '0' e '1'
+        """
+        if chunk.count("0") + chunk.count("1") != len(chunk):
+            raise ValueError(
+                "Erro: Não foi possível comprimir o texto, caractere inválido no texto cifrado. "
+                "Apenas '0' e '1' são permitidos, verifique se o texto foi adulterado."
+            )
+        
+        if not chunk:
+            return ""
+        
+        last = chunk[-1]
+        head = chunk.rstrip(last)
+        tail_len = len(chunk) - len(head)
+        
+        # A parte inteira continua a sequência pendente
+        if not head and last == self._run_bit:
+            self._run_len += tail_len
+            return ""
+        
+        output = []
+        if self._run_len:
+            # A sequência pendente continua no começo da parte
+            rest = head.lstrip(self._run_bit)
+            self._run_len += len(head) - len(rest)
+            head = rest
+            output.append(Compression.encode_run(self._run_bit, self._run_len))
+        
+        output.append(self._compression.compress(head))
+        self._run_bit, self._run_len = last, tail_len
+        
+        return "".join(output)
+    
+    def flush(self) -> str:
+        """
+        Encerra a compressão, emitindo a sequência pendente.
+        
+        Returns:
+            Texto comprimido restante
+        """
+        output = Compression.encode_run(self._run_bit, self._run_len) if self._run_len else ""
+        self._run_bit, self._run_len = "", 0
+        return output
+
+
+class Decompressor:
+    """
+    Descompressor incremental: aceita o texto comprimido em partes.
+    
+    A saída concatenada de feed() e flush() é idêntica a
+    Compression.decompress do texto inteiro.
+    """
+    
+    COUNT_CHARS = Compression.COUNT_CHARS
+    
+    def __init__(self):
+        """Inicializa o descompressor."""
+        self._compression = Compression()
+        self._pending = ""
+    
+    def feed(self, chunk: str) -> str:
+        """
+        Descomprime a próxima parte do texto comprimido.
+        
+        Uma contagem que termina no fim da parte fica pendente até a chegada
+        do bit que ela repete.
+        
+        Args:
+            chunk: Próxima parte do texto comprimido
+            
+        Returns:
+            Texto binário produzido por esta parte
+            
+        Raises:
+            DecompressionError: Se houver caractere inválido
+        """
+        data = self._pending + chunk
+        cut = max(data.rfind("0"), data.rfind("1")) + 1
+        self._pending = data[cut:]
+        
+        if self._pending.strip(self.COUNT_CHARS):
+            raise DecompressionError(
+                "Erro: Não foi possível descomprimir o texto, caractere inválido no texto comprimido."
+            )
+        
+        if not cut:
+            return ""
+        
+        return self._compression.decompress(data[:cut])
+    
+    def flush(self) -> str:
+        """
+        Encerra a descompressão.
+        
+        Uma contagem sem bit ao final é descartada, como em Compression.decompress.
+        
+        Returns:
+            Texto binário restante (sempre vazio)
+        """
+        self._pending = ""
+        return ""
+
+
+class TextCodec(ABC):
+    """
+    Codec de texto para ciphertext binário.
+    
+    Subclasses definem name, codec_id (um caractere, gravado nos cabeçalhos),
+    fast (se participa da política "fastest") e group (caracteres por grupo
+    decodificável isoladamente, ou 0 se o texto só pode ser decodificado inteiro).
+    """
+    
+    name = ""
+    codec_id = ""
+    fast = True
+    group = 0
+    
+    @abstractmethod
+    def encode(self, bits: str) -> str:
+        """Codifica texto binário (sem cabeçalho)."""
+    
+    @abstractmethod
+    def decode(self, payload: str, bit_length: int) -> str:
+        """
+        Decodifica os dados de volta para exatamente bit_length bits.
+        
+        Raises:
+            DecompressionError: Se os dados forem inválidos
+        """
+    
+    @abstractmethod
+    def unpack(self, payload: str) -> str:
+        """Decodifica todos os bits dos dados (incluindo os de preenchimento)."""
+
+
+class RLECodec(TextCodec):
+    """Codec RLE de Compression (contagem + bit), usado nos blocos do modo adaptativo."""
+    
+    name = Compression.CODEC_RLE
+    codec_id = "r"
+    
+    def __init__(self):
+        """Inicializa o codec."""
+        self._compression = Compression()
+    
+    def encode(self, bits: str) -> str:
+        """Comprime com RLE."""
+        return self._compression.compress(bits)
+    
+    def decode(self, payload: str, bit_length: int) -> str:
+        """Descomprime e confere o número de bits."""
+        bits = self._compression.decompress(payload)
+        if len(bits) != bit_length:
+            raise DecompressionError("Erro: Bloco RLE com comprimento diferente do declarado.")
+        return bits
+    
+    def unpack(self, payload: str) -> str:
+        """Descomprime (o RLE não tem bits de preenchimento)."""
+        return self._compression.decompress(payload)
+
+
+class PackedCodec(TextCodec):
+    """Codec de bits empacotados (8 por byte), transformados em bytes e codificados como texto."""
+    
+    def __init__(
+        self,
+        name: str,
+        codec_id: str,
+        encode_bytes: Callable[[bytes], bytes],
+        decode_bytes: Callable[[bytes], bytes],
+        group: int = 0,
+        fast: bool = True,
+    ):
+        """
+        Inicializa o codec.
+        
+        Args:
+            name: Nome do codec
+            codec_id: Id de um caractere gravado nos cabeçalhos
+            encode_bytes: Bytes empacotados -> bytes ASCII
+            decode_bytes: Bytes ASCII -> bytes empacotados
+            group: Caracteres por grupo decodificável isoladamente (0 = nenhum)
+            fast: Se participa da política "fastest"
+        """
+        self.name = name
+        self.codec_id = codec_id
+        self.group = group
+        self.fast = fast
+        self._encode_bytes = encode_bytes
+        self._decode_bytes = decode_bytes
+    
+    def encode(self, bits: str) -> str:
+        """Empacota os bits e codifica."""
+        return self._encode_bytes(BitPacking.pack(bits)).decode("ascii")
+    
+    def decode(self, payload: str, bit_length: int) -> str:
+        """Decodifica e desempacota exatamente bit_length bits."""
+        bits = self.unpack(payload)
+        if not 0 <= len(bits) - bit_length < 8:
+            raise DecompressionError("Erro: Texto empacotado com comprimento diferente do declarado.")
+        return bits[:bit_length]
+    
+    def unpack(self, payload: str) -> str:
+        """Decodifica e desempacota todos os bits (incluindo os de preenchimento)."""
+        return BitPacking.unpack(self._decode(payload))
+    
+    def _decode(self, payload: str) -> bytes:
+        """Decodifica os dados em bytes empacotados, convertendo erros em DecompressionError."""
+        try:
+            return self._decode_bytes(payload.encode("ascii"))
+        except _CODEC_ERRORS as e:
+            raise DecompressionError(f"Erro: Texto empacotado inválido ({e})") from e
+
+
+Compression.register_codec(RLECodec())
+Compression.register_codec(PackedCodec(
+    Compression.CODEC_BASE64, "6", base64.b64encode, base64.b64decode, group=4,
+))
+Compression.register_codec(PackedCodec(
+    Compression.CODEC_BASE85, "8", base64.b85encode, base64.b85decode, group=5,
+))
+Compression.register_codec(PackedCodec(
+    Compression.CODEC_ZLIB, "z",
+    lambda data: base64.b85encode(zlib.compress(data, 9)),
+    lambda text: zlib.decompress(base64.b85decode(text)),
+))
+if LZMA_AVAILABLE:
+    Compression.register_codec(PackedCodec(
+        Compression.CODEC_LZMA, "x",
+        lambda data: base64.b85encode(lzma.compress(data)),
+        lambda text: lzma.decompress(base64.b85decode(text)),
+        fast=False,
+    ))
+
+
+class PackedTextDecoder:
+    """
+    Decodificador incremental de texto gerado por Compression.pack_text.
+    
+    Codecs com grupos fixos (base64, base85) são decodificados grupo a grupo,
+    retendo o último byte até flush(), quando os bits de preenchimento são
+    descartados. No modo adaptativo cada bloco é decodificado assim que
+    chega por inteiro. Os demais codecs (zlib, lzma) são decodificados no flush().
+    """
+    
+    def __init__(self):
+        """Inicializa o decodificador."""
+        self._codec: Optional[TextCodec] = None
+        self._adaptive = False
+        self._fill = 0
+        self._pending = ""
+        self._tail = ""
+    
+    def feed(self, chunk: str) -> str:
+        """
+        Decodifica a próxima parte do texto codificado.
+        
+        Args:
+            chunk: Próxima parte do texto codificado
+            
+        Returns:
+            Texto binário produzido por esta parte
+            
+        Raises:
+            DecompressionError: Se o cabeçalho ou os dados forem inválidos
+        """
+        data = self._pending + chunk
+        
+        if self._codec is None and not self._adaptive:
+            if len(data) >= 2 and data[1] == Compression.ADAPTIVE_ID and Compression.is_packed_text(data):
+                self._adaptive = True
+                data = data[2:]
+            elif len(data) < Compression.PACKED_HEADER_LENGTH:
+                self._pending = data
+                return ""
+            else:
+                self._codec, self._fill = Compression._parse_packed_header(data)
+                data = data[Compression.PACKED_HEADER_LENGTH:]
+        
+        if self._adaptive:
+            return self._feed_blocks(data)
+        
+        if not self._codec.group:
+            self._pending = data
+            return ""
+        
+        cut = len(data) - len(data) % self._codec.group
+        self._pending = data[cut:]
+        
+        bits = self._tail + (self._codec.unpack(data[:cut]) if cut else "")
+        self._tail = bits[-8:]
+        return bits[:-8]
+    
+    def flush(self) -> str:
+        """
+        Encerra a decodificação.
+        
+        Returns:
+            Texto binário restante, sem os bits de preenchimento
+            
+        Raises:
+            DecompressionError: Se o texto terminar no meio de um cabeçalho ou bloco
+        """
+        pending, self._pending = self._pending, ""
+        tail, self._tail = self._tail, ""
+        
+        if self._adaptive:
+            if pending:
+                raise DecompressionError("Erro: Texto adaptativo terminou no meio de um bloco.")
+            return ""
+        
+        if self._codec is None:
+            if pending:
+                raise DecompressionError("Erro: Cabeçalho de texto empacotado ausente ou incompleto.")
+            return ""
+        
+        bits = tail + (self._codec.unpack(pending) if pending else "")
+        return bits[:len(bits) - self._fill]
+    
+    def _feed_blocks(self, data: str) -> str:
+        """Decodifica os blocos adaptativos completos e guarda o restante."""
+        output: List[str] = []
+        ptr = 0
+        
+        while True:
+            header = self._read_block_header(data, ptr)
+            if header is None:
+                break
+            codec, bit_length, payload_length, start = header
+            if len(data) < start + payload_length:
+                break
+            output.append(codec.decode(data[start:start + payload_length], bit_length))
+            ptr = start + payload_length
+        
+        self._pending = data[ptr:]
+        return "".join(output)
+    
+    @staticmethod
+    def _read_block_header(data: str, ptr: int) -> Optional[Tuple[TextCodec, int, int, int]]:
+        """
+        Lê o cabeçalho [id][#bits][#caracteres] de um bloco adaptativo.
+        
+        Returns:
+            Tupla contendo (codec, bits, caracteres, início_dos_dados), ou None se incompleto
+        """
+        if len(data) <= ptr:
+            return None
+        codec = Compression._codec_by_id(data[ptr])
+        ptr += 1
+        
+        values = []
+        for _ in range(2):
+            if len(data) < ptr + 3:
+                return None
+            digits = data[ptr:ptr + 3]
+            if not digits.isdigit():
+                raise DecompressionError("Erro: Cabeçalho de bloco adaptativo inválido.")
+            length = int(digits)
+            ptr += 3
+            if len(data) < ptr + length:
+                return None
+            value = data[ptr:ptr + length]
+            if not value.isdigit():
+                raise DecompressionError("Erro: Cabeçalho de bloco adaptativo inválido.")
+            values.append(int(value))
+            ptr += length
+        
+        return codec, values[0], values[1], ptr
@@ -1,17 +1,62 @@
 """Módulo de descriptografia."""
+import random
 import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate, compress, cycle, islice
+from multiprocessing import shared_memory
 from typing import List, Optional, Tuple, Dict
 
-from ..tables import TableGenerator
+from ..tables import TableCache, shared_table_cache
 from .compression import Compression
+from .bitpacking import BitPacking
+from .encryption import Encryption
+from .key_generator import KeyGenerator
+
+
+# Tabelas invertidas do processo do pool, preenchidas uma vez por _init_decode_worker
+_worker_tables: Dict[int, Dict[str, str]] = {}
+
+
+def _init_decode_worker(seed: int, passes: List[int]) -> None:
+    """Obtém as tabelas invertidas uma única vez por processo do pool (a partir da seed)."""
+    for passe in passes:
+        _worker_tables[passe] = shared_table_cache.get(seed * 1000000 + passe, passe)[1].copy()
+
+
+def _decode_window(task: Tuple[str, int, List[int], List[int]]) -> str:
+    """Decodifica uma faixa de segmentos lida da memória compartilhada (executa no pool)."""
+    shm_name, size, offsets, passes = task
+    dict_tables_por_passe = _worker_tables
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        buf = shm.buf
+        plaintext = []
+        for offset, passe in zip(offsets, passes):
+            end = min(offset + passe, size)
+            char = dict_tables_por_passe[passe].get(str(buf[offset:end], "ascii"))
+            if char is not None:
+                plaintext.append(char)
+        del buf
+        return "".join(plaintext)
+    finally:
+        shm.close()
 
 
 class Decryption:
     """Classe para descriptografar texto usando tabelas de substituição."""
     
-    def __init__(self):
-        """Inicializa o módulo de descriptografia."""
+    # Abaixo deste número de segmentos o custo de iniciar processos supera o ganho
+    PARALLEL_MIN_SEGMENTS = 1 << 14
+    
+    def __init__(self, table_cache: Optional[TableCache] = None):
+        """
+        Inicializa o módulo de descriptografia.
+        
+        Args:
+            table_cache: Cache de tabelas (opcional, usa o cache compartilhado do processo)
+        """
         self.compression = Compression()
+        self.table_cache = table_cache if table_cache is not None else shared_table_cache
     
     @staticmethod
     def _remove_ansi(s: str) -> str:
@@ -23,6 +68,7 @@ class Decryption:
         ciphertext: str,
         key: str,
         started_with_compressed: Optional[bool] = None,
+        workers: int = 1,
     ) -> Tuple[str, Dict]:
         """
         Descriptografa texto cifrado usando a chave fornecida.
@@ -31,6 +77,7 @@ class Decryption:
             ciphertext: Texto cifrado (pode estar comprimido)
             key: Chave de descriptografia
             started_with_compressed: Se True, indica que o texto já estava comprimido
+            workers: Número de processos para decodificar os segmentos (1 = sem paralelismo)
             
         Returns:
             Tupla contendo (plaintext, info_dict)
@@ -48,52 +95,86 @@ class Decryption:
         if not isinstance(ciphertext, str) or not isinstance(key, str):
             raise ValueError("ciphertext e key devem ser strings.")
         
-        # Detecta se está comprimido
-        is_compressed = False
-        for char in ciphertext:
-            if char not in ["0", "1"]:
-                is_compressed = True
-                break
+        # Detecta o codec: empacotado (pelo cabeçalho), RLE ou texto binário puro
+        if Compression.is_packed_text(ciphertext):
+            is_compressed = True
+            ciphertext = self.compression.unpack_text(ciphertext)
+        else:
+            is_compressed = not BitPacking.is_binary(ciphertext)
+            if is_compressed:
+                ciphertext = self.compression.decompress(ciphertext)
         
         if started_with_compressed is None:
             started_with_compressed = is_compressed
         
-        # Descomprime se necessário
-        if is_compressed:
-            decompressed = self.compression.decompress(ciphertext)
-            if decompressed.startswith("Erro"):
-                raise ValueError(decompressed)
-            ciphertext = decompressed
+        return self._decrypt_binary(ciphertext, key, started_with_compressed, is_compressed, workers)
+    
+    def decrypt_bytes(self, ciphertext: bytes, key: str, workers: int = 1) -> Tuple[str, Dict]:
+        """
+        Descriptografa ciphertext empacotado em bytes (8 bits por byte).
+        
+        Args:
+            ciphertext: Ciphertext empacotado, como gerado por Encryption.encrypt_bytes
+            key: Chave de descriptografia
+            workers: Número de processos para decodificar os segmentos (1 = sem paralelismo)
+            
+        Returns:
+            Tupla contendo (plaintext, info_dict)
+            
+        Raises:
+            ValueError: Se ciphertext ou key forem inválidos
+        """
+        if not isinstance(ciphertext, (bytes, bytearray, memoryview)) or not isinstance(key, str):
+            raise ValueError("ciphertext deve ser bytes e key deve ser string.")
+        
+        key = self._remove_ansi(key)
+        
+        if not ciphertext or not key:
+            raise ValueError("ciphertext e/ou key ausentes. Forneça valores válidos.")
+        
+        # Os bits que completam o último byte são descartados pelo comprimento declarado na chave
+        bits = BitPacking.unpack(bytes(ciphertext))
         
+        return self._decrypt_binary(bits, key, False, False, workers)
+    
+    def _decrypt_binary(
+        self,
+        ciphertext: str,
+        key: str,
+        started_with_compressed: bool,
+        is_compressed: bool,
+        workers: int = 1,
+    ) -> Tuple[str, Dict]:
+        """
+        Decodifica o ciphertext binário (já descomprimido) usando a chave.
+        
+        Args:
+            ciphertext: Texto cifrado binário
+            key: Chave de descriptografia
+            started_with_compressed: Se True, indica que o texto já estava comprimido
+            is_compressed: Se o ciphertext recebido estava comprimido (informativo)
+            workers: Número de processos para decodificar os segmentos
+            
+        Returns:
+            Tupla contendo (plaintext, info_dict)
+        """
         # Parse da chave
-        parsed_data = self._parse_key(ciphertext, key, started_with_compressed)
-        passes, seed, ciphertext_list = parsed_data
+        passes, seed, ct_eff, offsets = self._parse_key(ciphertext, key, started_with_compressed)
         
-        # Gera tabelas invertidas para descriptografia
-        seeds_por_passe = []
+        # Gera tabelas invertidas para descriptografia, uma por tamanho de passe distinto
+        # (cópias: o cache entrega tabelas somente leitura)
         dict_tables_por_passe = {}
         
-        for i, passe in enumerate(passes):
-            seed_passe = seed * 1000000 + passe
-            seeds_por_passe.append(seed_passe)
-            
-            table_gen = TableGenerator(seed_passe)
-            _, inverted_tables = table_gen.generate_tables([passe])
-            dict_tables_por_passe[passe] = inverted_tables[passe]
+        for passe in dict.fromkeys(passes):
+            dict_tables_por_passe[passe] = self.table_cache.get(seed * 1000000 + passe, passe)[1].copy()
         
         # Descriptografa
-        plaintext = []
-        for n, p in enumerate(passes):
-            if n < len(ciphertext_list):
-                val = ciphertext_list[n]
-                inv_table = dict_tables_por_passe[p]
-                if val in inv_table:
-                    plaintext.append(inv_table[val])
-                else:
-                    # Caractere não encontrado na tabela
-                    pass
-        
-        plaintext_str = "".join(plaintext)
+        if workers > 1 and len(passes) >= self.PARALLEL_MIN_SEGMENTS:
+            plaintext = self._decode_parallel(ct_eff, passes, offsets, seed, workers)
+        else:
+            plaintext = self._decode_segments(ct_eff, passes, offsets, dict_tables_por_passe)
+        
+        plaintext_str = plaintext
         
         info_dict = {
             "plaintext": plaintext_str,
@@ -104,12 +185,78 @@ class Decryption:
         
         return (plaintext_str, info_dict)
     
+    @staticmethod
+    def _decode_segments(
+        ciphertext: str,
+        passes: List[int],
+        offsets: List[int],
+        dict_tables_por_passe: Dict[int, Dict[str, str]],
+    ) -> str:
+        """
+        Decodifica os segmentos localizados por (offset, passe).
+        
+        Segmentos que não estão na tabela do passe são ignorados.
+        """
+        plaintext = []
+        for offset, passe in zip(offsets, passes):
+            char = dict_tables_por_passe[passe].get(ciphertext[offset:offset + passe])
+            if char is not None:
+                plaintext.append(char)
+        
+        return "".join(plaintext)
+    
+    @staticmethod
+    def _decode_parallel(
+        ciphertext: str,
+        passes: List[int],
+        offsets: List[int],
+        seed: int,
+        workers: int,
+    ) -> str:
+        """
+        Decodifica faixas de segmentos em vários processos.
+        
+        O ciphertext é copiado uma vez para memória compartilhada; cada processo
+        recebe só os offsets da sua faixa e lê a janela correspondente. As
+        tabelas não vão nas tarefas: cada processo as obtém uma vez, na
+        inicialização, a partir da seed e dos passes distintos.
+        
+        Args:
+            ciphertext: Texto cifrado binário (sem padding)
+            passes: Passe de cada segmento
+            offsets: Posição inicial de cada segmento (soma prefixada dos passes)
+            seed: Seed principal (define as tabelas de cada passe)
+            workers: Número de processos
+            
+        Returns:
+            Plaintext
+        """
+        data = ciphertext.encode("ascii")
+        shm = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+        try:
+            shm.buf[:len(data)] = data
+            
+            step = -(-len(passes) // workers)
+            tasks = []
+            for start in range(0, len(passes), step):
+                tasks.append((shm.name, len(data), offsets[start:start + step], passes[start:start + step]))
+            
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(tasks)),
+                initializer=_init_decode_worker,
+                initargs=(seed, list(dict.fromkeys(passes))),
+            ) as executor:
+                return "".join(executor.map(_decode_window, tasks))
+        finally:
+            shm.close()
+            shm.unlink()
+    
     def _parse_key(
         self,
         ciphertext: str,
         key: str,
         started_with_compressed: bool,
-    ) -> Tuple[List[int], int, List[str]]:
+    ) -> Tuple[List[int], int, str, List[int]]:
         """
         Faz parse da chave e retorna dados necessários para descriptografia.
         
@@ -119,26 +266,390 @@ class Decryption:
             started_with_compressed: Se True, texto estava comprimido
             
         Returns:
-            Tupla contendo (passes, seed, ciphertext_list)
+            Tupla contendo (passes, seed, ciphertext_efetivo, offsets)
         """
-        # Tenta primeiro com formato com salt, depois sem salt
-        try:
-            return self._parse_key_with_salt(ciphertext, key, started_with_compressed)
-        except Exception:
-            return self._parse_key_without_salt(ciphertext, key, started_with_compressed)
+        fields = self._read_key(key, len(ciphertext))
+        label = "com salt" if fields["salt_flag"] == "1" else "sem salt"
+        return self._segment(ciphertext, fields, started_with_compressed, label)
     
-    def _parse_key_with_salt(
+    def _read_key(
         self,
-        ciphertext: str,
         key: str,
-        started_with_compressed: bool,
-    ) -> Tuple[List[int], int, List[str]]:
-        """Faz parse de chave com formato que inclui salt."""
-        ptr = 0
+        ciphertext_length: Optional[int] = None,
+        expand: bool = True,
+        max_length: Optional[int] = None,
+        max_salted_segments: Optional[int] = None,
+    ) -> Dict:
+        """
+        Lê apenas os campos da chave, sem depender do conteúdo do ciphertext.
+        
+        Chaves versionadas são lidas pelo decodificador da sua versão. Chaves
+        legadas (sem cabeçalho) são lidas no formato com salt e, se a soma dos
+        passes não bater com o comprimento declarado, no formato sem salt.
+        
+        Args:
+            key: Chave de descriptografia
+            ciphertext_length: Comprimento do ciphertext binário, se conhecido;
+                limita o comprimento declarado na chave antes de expandir os passes
+            expand: Se False, chaves v2 não têm os passes expandidos (ver
+                _read_key_cycle); chaves v1 e legadas sempre trazem passes
+            max_length: Limite para o comprimento declarado e a quantidade de
+                caracteres, quando o ciphertext ainda não é conhecido (streaming)
+            max_salted_segments: Limite de segmentos (mensagem + salt) de chaves
+                com salt, cujo salt é reconstruído antes de qualquer ciphertext
+            
+        Returns:
+            Dicionário com posicoes, salt_flag, passes, cl, seed e padding
+            
+        Raises:
+            ValueError: Se a chave for inválida, de versão desconhecida ou
+                acima dos limites
+        """
+        if key.startswith(KeyGenerator.KEY_MARKER):
+            return self._read_key_versioned(
+                key, ciphertext_length, expand, max_length, max_salted_segments
+            )
+        
+        fields = self._read_key_legacy(key)
+        if max_length is not None and fields["cl"] > max_length:
+            raise ValueError("Chave inválida: comprimento declarado acima do limite")
+        return fields
+    
+    @staticmethod
+    def _read_key_versioned(
+        key: str,
+        ciphertext_length: Optional[int] = None,
+        expand: bool = True,
+        max_length: Optional[int] = None,
+        max_salted_segments: Optional[int] = None,
+    ) -> Dict:
+        """Lê chave com cabeçalho [marcador][versão][salt_flag] (limites em _read_key)."""
+        if len(key) < KeyGenerator.HEADER_LENGTH:
+            raise ValueError("Chave inválida: incompleta (cabeçalho)")
+        
+        version = key[1]
+        salt_flag = key[2]
+        ptr = KeyGenerator.HEADER_LENGTH
+        
+        if version == KeyGenerator.KEY_VERSION:
+            if salt_flag not in (KeyGenerator.SALT_NONE, KeyGenerator.SALT_EXPLICIT):
+                raise ValueError("Chave inválida: flag de salt deve ser '0' ou '1'")
+            posicoes: List[int] = []
+            if salt_flag == KeyGenerator.SALT_EXPLICIT:
+                posicoes, ptr = Decryption._read_salt_positions(key, ptr)
+            fields = Decryption._read_key_body(key, ptr)
+            fields["posicoes"] = posicoes
+            if max_length is not None and fields["cl"] > max_length:
+                raise ValueError("Chave inválida: comprimento declarado acima do limite")
+        elif version == KeyGenerator.KEY_VERSION_CYCLE:
+            if salt_flag not in (
+                KeyGenerator.SALT_NONE, KeyGenerator.SALT_EXPLICIT, KeyGenerator.SALT_FROM_SEED,
+            ):
+                raise ValueError("Chave inválida: flag de salt deve ser '0', '1' ou '2'")
+            fields = Decryption._read_key_cycle(
+                key, ptr, salt_flag, ciphertext_length, expand, max_length, max_salted_segments
+            )
+        else:
+            raise ValueError(f"Chave inválida: versão {version} não suportada")
+        
+        # Para a segmentação, qualquer modo de salt tem as posições já resolvidas
+        fields["salt_flag"] = "0" if salt_flag == KeyGenerator.SALT_NONE else "1"
+        return fields
+    
+    @staticmethod
+    def _read_key_cycle(
+        key: str,
+        ptr: int,
+        salt_flag: str,
+        ciphertext_length: Optional[int] = None,
+        expand: bool = True,
+        max_length: Optional[int] = None,
+        max_salted_segments: Optional[int] = None,
+    ) -> Dict:
+        """
+        Lê o corpo da chave no formato de ciclo (versão 2) e reconstrói os passes.
+        
+        Os campos de comprimento são conferidos entre si, com o ciphertext (se
+        conhecido) e com os limites antes de qualquer alocação proporcional ao
+        texto e do sorteio do salt.
+        
+        Args:
+            key: Chave de descriptografia
+            ptr: Posição após o cabeçalho
+            salt_flag: Flag de salt do cabeçalho
+            ciphertext_length: Comprimento do ciphertext binário (opcional)
+            expand: Se False, não expande os passes por segmento; o chamador usa
+                pass_cycle, invalid_positions e o salt para calculá-los sob demanda
+            max_length: Limite para plaintext_length e cl (opcional)
+            max_salted_segments: Limite para salt_l e, com salt, para o total de
+                segmentos (opcional)
+            
+        Returns:
+            Dicionário com posicoes, salt_passes, pass_cycle, plaintext_length,
+            invalid_positions (ordenadas), cl, seed, padding e, se expand,
+            passes (já com o salt)
+        
+        Raises:
+            ValueError: Se a chave for inválida ou incompatível com o ciphertext
+        """
+        read = Decryption._read_counted
+        
+        salt_positions = []
+        salt_passes = []
+        salt_l = 0
+        if salt_flag != KeyGenerator.SALT_NONE:
+            salt_l, ptr = read(key, ptr, "salt_l")
+            if max_salted_segments is not None and salt_l > max_salted_segments:
+                raise ValueError("Chave inválida: quantidade de salt acima do limite")
+        
+        if salt_flag == KeyGenerator.SALT_FROM_SEED:
+            if len(key) < ptr + 6:
+                raise ValueError("Chave inválida: incompleta (faixa de passes do salt)")
+            salt_table_range = (
+                Decryption._to_int(key[ptr:ptr + 3], "faixa de passes do salt"),
+                Decryption._to_int(key[ptr + 3:ptr + 6], "faixa de passes do salt"),
+            )
+            ptr += 6
+        elif salt_flag == KeyGenerator.SALT_EXPLICIT:
+            # Cada item ocupa ao menos 6 caracteres (#posição + passe)
+            if salt_l * 6 > len(key) - ptr:
+                raise ValueError("Chave inválida: incompleta (salt)")
+            for _ in range(salt_l):
+                pos, ptr = read(key, ptr, "posicao")
+                if len(key) < ptr + 3:
+                    raise ValueError("Chave inválida: incompleta (passe do salt)")
+                salt_positions.append(pos)
+                salt_passes.append(Decryption._to_int(key[ptr:ptr + 3], "passe do salt"))
+                ptr += 3
+        
+        plaintext_length, ptr = read(key, ptr, "comprimento do texto")
+        if max_length is not None and plaintext_length > max_length:
+            raise ValueError("Chave inválida: comprimento do texto acima do limite")
+        cycle_len, ptr = read(key, ptr, "ciclo")
+        if len(key) < ptr + 3 * cycle_len:
+            raise ValueError("Chave inválida: incompleta (ciclo)")
+        pass_cycle = [Decryption._to_int(key[i:i + 3], "ciclo") for i in range(ptr, ptr + 3 * cycle_len, 3)]
+        ptr += 3 * cycle_len
+        if plaintext_length and not pass_cycle:
+            raise ValueError("Chave inválida: ciclo de passes vazio")
+        
+        n_invalid, ptr = read(key, ptr, "inválidos")
+        if n_invalid > plaintext_length:
+            raise ValueError("Chave inválida: mais posições inválidas que caracteres")
+        invalid_positions = []
+        for _ in range(n_invalid):
+            pos, ptr = read(key, ptr, "posição inválida")
+            if not 0 <= pos < plaintext_length:
+                raise ValueError("Chave inválida: posição inválida fora do texto")
+            invalid_positions.append(pos)
+        
+        cl, ptr = read(key, ptr, "cl")
+        seed, ptr = read(key, ptr, "seed")
+        padding = Decryption._to_int(key[ptr:], "padding") if ptr < len(key) else 0
+        
+        invalid_positions = sorted(set(invalid_positions))
+        segments = plaintext_length - len(invalid_positions)
+        
+        # Cada segmento da mensagem tem ao menos o menor passe do ciclo: o
+        # comprimento declarado limita o número de segmentos, e o ciphertext
+        # limita o comprimento declarado
+        if ciphertext_length is not None and cl > ciphertext_length:
+            raise ValueError("Chave inválida: comprimento declarado maior que o ciphertext")
+        if max_length is not None and cl > max_length:
+            raise ValueError("Chave inválida: comprimento declarado acima do limite")
+        if pass_cycle and segments * min(pass_cycle) > cl:
+            raise ValueError("Chave inválida: comprimento do texto incompatível com o ciphertext")
+        
+        # A criptografia sorteia entre 20 e 20 + segmentos itens de salt
+        if salt_flag != KeyGenerator.SALT_NONE and not 20 <= salt_l <= 20 + segments:
+            raise ValueError("Chave inválida: quantidade de salt fora do intervalo")
+        
+        # Com salt, o sorteio e os índices finais custam O(segmentos + salt)
+        if (
+            salt_flag != KeyGenerator.SALT_NONE
+            and max_salted_segments is not None
+            and segments + salt_l > max_salted_segments
+        ):
+            raise ValueError("Chave inválida: mensagem com salt acima do limite")
+        
+        # Salt sorteado de novo com a seed, na mesma ordem da criptografia
+        if salt_flag == KeyGenerator.SALT_FROM_SEED and salt_l:
+            if not segments or salt_table_range[0] > salt_table_range[1]:
+                raise ValueError("Chave inválida: salt sem segmentos ou faixa de passes inválida")
+            salt_passes, salt_positions, _ = Encryption._draw_salt(
+                random.Random(seed), segments, salt_l, *salt_table_range
+            )
+        
+        for k, pos in enumerate(salt_positions):
+            if not 0 <= pos < segments + k:
+                raise ValueError("Chave inválida: posição de salt fora do intervalo")
+        
+        fields = {
+            "cl": cl,
+            "seed": seed,
+            "padding": padding,
+            "posicoes": salt_positions,
+            "salt_passes": salt_passes,
+            "pass_cycle": pass_cycle,
+            "plaintext_length": plaintext_length,
+            "invalid_positions": invalid_positions,
+        }
+        if not expand:
+            return fields
+        
+        # Passes dos segmentos da mensagem: ciclo sem as posições inválidas
+        passes = list(islice(cycle(pass_cycle), plaintext_length))
+        if invalid_positions:
+            keep = bytearray(b"\x01") * plaintext_length
+            for pos in invalid_positions:
+                keep[pos] = 0
+            passes = list(compress(passes, keep))
+        
+        # Salt inserido na mesma ordem da criptografia
+        if salt_positions:
+            total = len(passes) + len(salt_positions)
+            final_indices = Encryption._final_insert_indices(salt_positions, total)
+            passes = Encryption._merge_inserts(passes, salt_passes, final_indices)
+        
+        fields["passes"] = passes
+        return fields
+    
+    @staticmethod
+    def _to_int(text: str, field: str) -> int:
+        """
+        Converte um campo numérico da chave.
+        
+        Args:
+            text: Trecho da chave
+            field: Nome do campo, usado na mensagem de erro
+        
+        Returns:
+            Valor inteiro do campo
         
-        if len(key) < 3:
+        Raises:
+            ValueError: "Chave inválida: ..." se o trecho não for numérico
+        """
+        try:
+            return int(text)
+        except ValueError:
+            shown = text if len(text) <= 20 else text[:20] + "..."
+            raise ValueError(f"Chave inválida: campo {field} não numérico ({shown!r})") from None
+    
+    @staticmethod
+    def _read_counted(key: str, ptr: int, field: str) -> Tuple[int, int]:
+        """Lê um inteiro precedido pelo seu número de dígitos (3 dígitos)."""
+        if len(key) < ptr + 3:
+            raise ValueError(f"Chave inválida: incompleta ({field})")
+        length = Decryption._to_int(key[ptr:ptr + 3], field)
+        ptr += 3
+        if len(key) < ptr + length:
+            raise ValueError(f"Chave inválida: incompleta ({field})")
+        value = Decryption._to_int(key[ptr:ptr + length], field) if length else 0
+        return value, ptr + length
+    
+    @staticmethod
+    def _read_key_legacy(key: str) -> Dict:
+        """
+        Lê chave legada (sem cabeçalho), detectando o formato pelos campos.
+        
+        Apenas os campos são lidos; o ciphertext é segmentado uma única vez,
+        depois que o formato já foi decidido.
+        """
+        if Decryption._has_legacy_salt_layout(key):
+            return Decryption._read_key_with_salt(key)
+        
+        fields = Decryption._read_key_without_salt(key)
+        if fields["cl"] > 0 and sum(fields["passes"]) != fields["cl"]:
+            raise ValueError("inconsistência entre passes e comprimento declarado (sem salt)")
+        return fields
+    
+    @staticmethod
+    def _has_legacy_salt_layout(key: str) -> bool:
+        """
+        Confere se a chave legada segue o formato com salt, sem interpretá-la.
+        
+        Os campos de comprimento do prefixo de salt e do corpo precisam ser
+        numéricos e caber em len(key), e a soma dos passes precisa bater com
+        o comprimento declarado (quando positivo).
+        
+        Args:
+            key: Chave legada
+        
+        Returns:
+            True se a chave tiver o formato com salt
+        """
+        def field(ptr: int, length: int) -> Optional[str]:
+            value = key[ptr:ptr + length]
+            if len(value) != length or (value and not value.isdecimal()):
+                return None
+            return value
+        
+        def counted(ptr: int, allow_empty: bool) -> Tuple[Optional[int], int]:
+            size = field(ptr, 3)
+            if size is None:
+                return None, ptr
+            value = field(ptr + 3, int(size))
+            if value is None or (not value and not allow_empty):
+                return None, ptr
+            return int(value or 0), ptr + 3 + int(size)
+        
+        # Prefixo de salt: lol_salt, salt_l e uma posição (#pn_len + pos) por item
+        salt_l, ptr = counted(0, allow_empty=True)
+        if salt_l is None or salt_l * 4 > len(key) - ptr:
+            return False
+        for _ in range(salt_l):
+            pos, ptr = counted(ptr, allow_empty=False)
+            if pos is None:
+                return False
+        
+        # Flag de salt legada: lsf = 1 e um caractere
+        lsf = field(ptr, 3)
+        if lsf is None or int(lsf) != 1 or ptr + 4 > len(key):
+            return False
+        ptr += 4
+        
+        # Corpo: pl, passes, cl, seed e padding
+        pl, ptr = counted(ptr, allow_empty=True)
+        if pl is None or pl * 3 > len(key) - ptr:
+            return False
+        total = 0
+        for _ in range(pl):
+            passe = field(ptr, 3)
+            if passe is None:
+                return False
+            total += int(passe)
+            ptr += 3
+        cl, ptr = counted(ptr, allow_empty=False)
+        if cl is None:
+            return False
+        seed, ptr = counted(ptr, allow_empty=False)
+        if seed is None or field(ptr, len(key) - ptr) is None:
+            return False
+        
+        return cl <= 0 or total == cl
+    
+    @staticmethod
+    def _read_key_with_salt(key: str) -> Dict:
+        """Lê os campos de chave com formato que inclui salt."""
+        posicoes, ptr = Decryption._read_salt_positions(key, 0)
+        
+        fields = Decryption._read_key_tail(key, ptr)
+        fields["posicoes"] = posicoes
+        return fields
+    
+    @staticmethod
+    def _read_key_without_salt(key: str) -> Dict:
+        """Lê os campos de chave com formato sem salt."""
+        fields = Decryption._read_key_tail(key, 0)
+        fields["posicoes"] = []
+        return fields
+    
+    @staticmethod
+    def _read_salt_positions(key: str, ptr: int) -> Tuple[List[int], int]:
+        """Lê lol_salt, salt_l e as posições do salt a partir de ptr."""
+        if len(key) < ptr + 3:
             raise ValueError("Chave inválida: incompleta (lol_salt)")
-        lol_salt = int(key[ptr:ptr + 3])
+        lol_salt = Decryption._to_int(key[ptr:ptr + 3], "lol_salt")
         ptr += 3
         
         if lol_salt == 0:
@@ -146,36 +657,48 @@ class Decryption:
         else:
             if len(key) < ptr + lol_salt:
                 raise ValueError("Chave inválida: incompleta (salt_l)")
-            salt_l = int(key[ptr:ptr + lol_salt])
+            salt_l = Decryption._to_int(key[ptr:ptr + lol_salt], "salt_l")
             ptr += lol_salt
         
         posicoes = []
         for _ in range(salt_l):
             if len(key) < ptr + 3:
                 raise ValueError("Chave inválida: incompleta (len posicao)")
-            pn_len = int(key[ptr:ptr + 3])
+            pn_len = Decryption._to_int(key[ptr:ptr + 3], "len posicao")
             ptr += 3
             if pn_len < 0:
                 raise ValueError("Chave inválida: tamanho de posição negativo")
             if len(key) < ptr + pn_len:
                 raise ValueError("Chave inválida: incompleta (posicao)")
-            posicoes.append(int(key[ptr:ptr + pn_len]))
+            posicoes.append(Decryption._to_int(key[ptr:ptr + pn_len], "posicao"))
             ptr += pn_len
         
-        # Lê salt_flag
+        return posicoes, ptr
+    
+    @staticmethod
+    def _read_key_tail(key: str, ptr: int) -> Dict:
+        """Lê salt_flag (formato legado) e o corpo da chave a partir de ptr."""
+        # Lê salt_flag (mesmo sem salt, flag deve existir)
         if len(key) < ptr + 3:
             raise ValueError("Chave inválida: incompleta (lsf)")
-        lsf = int(key[ptr:ptr + 3])
+        lsf = Decryption._to_int(key[ptr:ptr + 3], "lsf")
         ptr += 3
         if lsf != 1 or len(key) < ptr + lsf:
             raise ValueError("Chave inválida: incompleta (sf)")
         salt_flag = key[ptr:ptr + lsf]
         ptr += lsf
         
+        fields = Decryption._read_key_body(key, ptr)
+        fields["salt_flag"] = salt_flag
+        return fields
+    
+    @staticmethod
+    def _read_key_body(key: str, ptr: int) -> Dict:
+        """Lê passes, comprimento, seed e padding a partir de ptr."""
         # Lê passes
         if len(key) < ptr + 3:
             raise ValueError("Chave inválida: incompleta (lol_p)")
-        lol_p = int(key[ptr:ptr + 3])
+        lol_p = Decryption._to_int(key[ptr:ptr + 3], "lol_p")
         ptr += 3
         
         if lol_p == 0:
@@ -183,34 +706,34 @@ class Decryption:
         else:
             if len(key) < ptr + lol_p:
                 raise ValueError("Chave inválida: incompleta (pl)")
-            pl = int(key[ptr:ptr + lol_p])
+            pl = Decryption._to_int(key[ptr:ptr + lol_p], "pl")
             ptr += lol_p
         
         passes = []
         for _ in range(pl):
             if len(key) < ptr + 3:
                 raise ValueError("Chave inválida: incompleta (pass)")
-            passes.append(int(key[ptr:ptr + 3]))
+            passes.append(Decryption._to_int(key[ptr:ptr + 3], "pass"))
             ptr += 3
         
         # Lê comprimento do ciphertext antes do padding
         if len(key) < ptr + 3:
             raise ValueError("Chave inválida: incompleta (lcl)")
-        lcl = int(key[ptr:ptr + 3])
+        lcl = Decryption._to_int(key[ptr:ptr + 3], "lcl")
         ptr += 3
         if lcl < 0 or len(key) < ptr + lcl:
             raise ValueError("Chave inválida: incompleta (cl)")
-        cl = int(key[ptr:ptr + lcl])
+        cl = Decryption._to_int(key[ptr:ptr + lcl], "cl")
         ptr += lcl
         
         # Lê seed
         if len(key) < ptr + 3:
             raise ValueError("Chave inválida: incompleta (sl)")
-        sl = int(key[ptr:ptr + 3])
+        sl = Decryption._to_int(key[ptr:ptr + 3], "sl")
         ptr += 3
         if sl < 0 or len(key) < ptr + sl:
             raise ValueError("Chave inválida: incompleta (seed)")
-        seed = int(key[ptr:ptr + sl])
+        seed = Decryption._to_int(key[ptr:ptr + sl], "seed")
         ptr += sl
         
         # Lê padding
@@ -218,116 +741,41 @@ class Decryption:
         if ptr < len(key):
             restante = key[ptr:]
             if restante:
-                padding = int(restante)
-        
-        # Aplica padding e ajusta pelo comprimento declarado
-        ct_eff = ciphertext
-        if padding > 0:
-            if padding > len(ct_eff):
-                raise ValueError("Padding maior que o tamanho do ciphertext")
-            ct_eff = ct_eff[:len(ct_eff) - padding]
+                padding = Decryption._to_int(restante, "padding")
         
-        if cl > 0 and len(ct_eff) != cl:
-            if len(ct_eff) > cl:
-                ct_eff = ct_eff[:cl]
-            else:
-                if not started_with_compressed:
-                    raise ValueError("Ciphertext menor que o comprimento declarado")
-        
-        # Valida soma e ajusta tolerantemente para entradas comprimidas
-        total_len = len(ct_eff)
-        sum_passes = sum(passes)
-        if sum_passes != total_len:
-            if started_with_compressed and passes:
-                delta = sum_passes - total_len
-                passes[-1] -= delta
-                if passes[-1] < 0:
-                    passes[-1] = 0
-            else:
-                raise ValueError("inconsistência entre passes e ciphertext (com salt)")
-        
-        # Segmenta
-        ciphertext_list = []
-        resto = ct_eff
-        for comp in passes:
-            ciphertext_list.append(resto[:comp])
-            resto = resto[comp:]
-        
-        # Remove salt apenas se flag ativa e houver posições
-        if salt_flag == "1" and posicoes:
-            for pos in reversed(posicoes):
-                if 0 <= pos < len(ciphertext_list):
-                    del ciphertext_list[pos]
-                    del passes[pos]
-        
-        return passes, seed, ciphertext_list
+        return {
+            "passes": passes,
+            "cl": cl,
+            "seed": seed,
+            "padding": padding,
+        }
     
-    def _parse_key_without_salt(
-        self,
+    @staticmethod
+    def _segment(
         ciphertext: str,
-        key: str,
+        fields: Dict,
         started_with_compressed: bool,
-    ) -> Tuple[List[int], int, List[str]]:
-        """Faz parse de chave com formato sem salt."""
-        ptr = 0
-        
-        # Lê salt_flag (mesmo sem salt, flag deve existir)
-        if len(key) < 3:
-            raise ValueError("Chave inválida: incompleta (lsf)")
-        lsf = int(key[ptr:ptr + 3])
-        ptr += 3
-        if lsf != 1 or len(key) < ptr + lsf:
-            raise ValueError("Chave inválida: incompleta (sf)")
-        salt_flag = key[ptr:ptr + lsf]
-        ptr += lsf
-        
-        # Lê passes
-        if len(key) < 3:
-            raise ValueError("Chave inválida: incompleta (lol_p)")
-        lol_p = int(key[ptr:ptr + 3])
-        ptr += 3
-        
-        if lol_p == 0:
-            pl = 0
-        else:
-            if len(key) < ptr + lol_p:
-                raise ValueError("Chave inválida: incompleta (pl)")
-            pl = int(key[ptr:ptr + lol_p])
-            ptr += lol_p
-        
-        passes = []
-        for _ in range(pl):
-            if len(key) < ptr + 3:
-                raise ValueError("Chave inválida: incompleta (pass)")
-            passes.append(int(key[ptr:ptr + 3]))
-            ptr += 3
-        
-        # Lê comprimento do ciphertext antes do padding
-        if len(key) < ptr + 3:
-            raise ValueError("Chave inválida: incompleta (lcl)")
-        lcl = int(key[ptr:ptr + 3])
-        ptr += 3
-        if lcl < 0 or len(key) < ptr + lcl:
-            raise ValueError("Chave inválida: incompleta (cl)")
-        cl = int(key[ptr:ptr + lcl])
-        ptr += lcl
+        label: str,
+    ) -> Tuple[List[int], int, str, List[int]]:
+        """
+        Localiza os segmentos do ciphertext pelos passes da chave e remove o salt.
         
-        # Lê seed
-        if len(key) < ptr + 3:
-            raise ValueError("Chave inválida: incompleta (sl)")
-        sl = int(key[ptr:ptr + 3])
-        ptr += 3
-        if sl < 0 or len(key) < ptr + sl:
-            raise ValueError("Chave inválida: incompleta (seed)")
-        seed = int(key[ptr:ptr + sl])
-        ptr += sl
+        Cada segmento é descrito pelo seu offset (soma prefixada dos passes)
+        no ciphertext efetivo, sem copiar o texto.
         
-        # Lê padding
-        padding = 0
-        if ptr < len(key):
-            restante = key[ptr:]
-            if restante:
-                padding = int(restante)
+        Args:
+            ciphertext: Texto cifrado binário
+            fields: Campos lidos da chave
+            started_with_compressed: Se True, texto estava comprimido
+            label: Formato da chave, usado nas mensagens de erro
+            
+        Returns:
+            Tupla contendo (passes, seed, ciphertext_efetivo, offsets)
+        """
+        passes = fields["passes"]
+        cl = fields["cl"]
+        padding = fields["padding"]
+        posicoes = fields["posicoes"]
         
         # Aplica padding e ajusta pelo comprimento declarado
         ct_eff = ciphertext
@@ -353,14 +801,43 @@ class Decryption:
                 if passes[-1] < 0:
                     passes[-1] = 0
             else:
-                raise ValueError("inconsistência entre passes e ciphertext (sem salt)")
+                raise ValueError(f"inconsistência entre passes e ciphertext ({label})")
         
-        # Segmenta
-        ciphertext_list = []
-        resto = ct_eff
-        for comp in passes:
-            ciphertext_list.append(resto[:comp])
-            resto = resto[comp:]
+        # Segmenta por offsets
+        offsets = list(accumulate(passes[:-1], initial=0)) if passes else []
         
-        return passes, seed, ciphertext_list
-
+        # Remove salt apenas se flag ativa e houver posições, em uma única passada
+        if fields["salt_flag"] == "1" and posicoes:
+            keep = bytearray(b"\x01") * len(offsets)
+            for idx in Decryption._salt_indices(posicoes, len(offsets)):
+                keep[idx] = 0
+            offsets = list(compress(offsets, keep))
+            passes = list(compress(passes, keep))
+        
+        return passes, fields["seed"], ct_eff, offsets
+    
+    @staticmethod
+    def _salt_indices(posicoes: List[int], total: int) -> List[int]:
+        """
+        Calcula os índices dos segmentos de salt na lista completa de segmentos.
+        
+        Equivale a desfazer os inserts do salt com del, do último para o
+        primeiro, ignorando posições fora da lista restante, mas sem mover
+        os itens a cada remoção.
+        
+        Args:
+            posicoes: Posições de inserção do salt, na ordem lida da chave
+            total: Quantidade total de segmentos (mensagem + salt)
+            
+        Returns:
+            Índices dos segmentos de salt
+        """
+        valid = []
+        remaining = total
+        for pos in reversed(posicoes):
+            if 0 <= pos < remaining:
+                valid.append(pos)
+                remaining -= 1
+        valid.reverse()
+        
+        return Encryption._final_insert_indices(valid, total)
@@ -5,6 +5,17 @@ from typing import List, Optional, Tuple
 class KeyGenerator:
     """Classe para geração de chaves polidas para descriptografia."""
     
+    # Cabeçalho: marcador (não numérico, ausente em chaves legadas), versão e flag de salt
+    KEY_MARKER = "H"
+    KEY_VERSION = "1"  # um passe por segmento
+    KEY_VERSION_CYCLE = "2"  # ciclo de passes uma vez, mais as exceções
+    HEADER_LENGTH = 3
+    
+    # Valores da flag de salt no cabeçalho
+    SALT_NONE = "0"
+    SALT_EXPLICIT = "1"  # posições e passes do salt gravados na chave
+    SALT_FROM_SEED = "2"  # apenas a quantidade; o resto é sorteado de novo a partir da seed
+    
     def __init__(self, debug_mode: bool = False):
         """
         Inicializa o gerador de chaves.
@@ -31,10 +42,18 @@ class KeyGenerator:
         salt_positions: Optional[List[str]] = None,
         padding: str = "",
         ct_len_before_padding: Optional[int] = None,
+        pass_cycle: Optional[List[int]] = None,
+        plaintext_length: int = 0,
+        invalid_positions: Optional[List[int]] = None,
+        salt_inserts: Optional[List[Tuple[int, int]]] = None,
+        salt_table_range: Optional[Tuple[int, int]] = None,
     ) -> Tuple[List[str], str, str]:
         """
         Gera chave polida para descriptografia posterior.
         
+        Com pass_cycle, gera a chave no formato de ciclo (versão 2), cujo tamanho
+        depende do ciclo e das exceções, e não do tamanho do texto.
+        
         Args:
             passes_list: Lista de passes utilizados
             current_seed: Seed principal
@@ -42,10 +61,28 @@ class KeyGenerator:
             salt_positions: Lista de posições de salt (opcional)
             padding: String de padding (opcional)
             ct_len_before_padding: Comprimento do ciphertext antes do padding (opcional)
+            pass_cycle: Ciclo de passes informado na criptografia (opcional, ativa a versão 2)
+            plaintext_length: Comprimento do texto plano, incluindo caracteres inválidos
+            invalid_positions: Índices do texto plano sem cifra (caracteres inválidos)
+            salt_inserts: Pares (posição de inserção, passe) de cada item de salt, na ordem
+            salt_table_range: (min_table_leng, max_table_leng) usados no sorteio do salt;
+                com ele a chave de ciclo guarda só a quantidade de salt (opcional)
             
         Returns:
             Tupla contendo (passes_formatados, chave_polida, chave_detalhada)
         """
+        if pass_cycle is not None:
+            return self._generate_cycle(
+                pass_cycle,
+                current_seed,
+                plaintext_length,
+                invalid_positions or [],
+                salt_inserts or [],
+                padding,
+                ct_len_before_padding or 0,
+                salt_table_range,
+            )
+        
         if salt_positions is None:
             salt_positions = []
         if seeds_passes is None:
@@ -70,15 +107,15 @@ class KeyGenerator:
         cl_str = str(ct_len_before_padding)
         lcl = str(len(cl_str)).zfill(3)
         
-        # Flag de salt explícita (1 = com salt, 0 = sem salt)
+        # Flag de salt explícita (1 = com salt, 0 = sem salt), em posição fixa do cabeçalho
         salt_flag = "1" if salt_positions else "0"
-        lsf = "001"  # comprimento fixo de 1
+        header = self.KEY_MARKER + self.KEY_VERSION + salt_flag
         
         # Informações sobre seeds dos passes
         seeds_l = str(len(seeds_passes)) if seeds_passes else "000"
         lol_seeds = str(len(seeds_l)).zfill(3) if seeds_passes else "000"
         
-        # Sempre incluir campos de salt, mesmo quando vazio
+        # Campos de salt só são escritos quando a flag está ativa
         salt_count = int(len(salt_positions) / 2) if salt_positions else 0
         salt_l = [str(salt_count)]
         lol_salt = [str(len(salt_l[0])).zfill(3)]
@@ -97,10 +134,11 @@ class KeyGenerator:
         
         # Gera chave detalhada (apenas para debug)
         crude_key = (
-            f"\nseed principal: {seed_value}\n\n"
+            f"\ncabeçalho: {header} (versão {self.KEY_VERSION})\n\n"
+            f"seed principal: {seed_value}\n\n"
             f"salt: lol_salt: {', '.join(lol_salt)}, salt_l: {', '.join(salt_l)}, \n"
             f"posições salt: {', '.join(poli_salt)}\n\n"
-            f"salt_flag: lsf: {lsf}, sf: {salt_flag}\n\n"
+            f"salt_flag: {salt_flag}\n\n"
             f"passes: lolp: {lolp}, pl: {pl}, \n"
             f"passes: {', '.join(poli_passes)}\n\n"
             f"ct_len_before_padding: lcl: {lcl}, cl: {cl_str}\n\n"
@@ -109,11 +147,10 @@ class KeyGenerator:
         
         # Gera chave polida (para uso real)
         polished_key = "".join([
-            "".join(lol_salt),
-            "".join(salt_l),
+            header,
+            "".join(lol_salt) if salt_positions else "",
+            "".join(salt_l) if salt_positions else "",
             "".join(poli_salt),
-            lsf,
-            salt_flag,
             "".join(lolp),
             "".join(pl),
             "".join(poli_passes),
@@ -125,4 +162,82 @@ class KeyGenerator:
         ])
         
         return (poli_passes, polished_key, crude_key)
-
+    
+    def _generate_cycle(
+        self,
+        pass_cycle: List[int],
+        current_seed: int,
+        plaintext_length: int,
+        invalid_positions: List[int],
+        salt_inserts: List[Tuple[int, int]],
+        padding: str,
+        ct_len_before_padding: int,
+        salt_table_range: Optional[Tuple[int, int]] = None,
+    ) -> Tuple[List[str], str, str]:
+        """
+        Gera chave no formato de ciclo (versão 2).
+        
+        Os passes de cada segmento são reconstruídos a partir do ciclo: posição j
+        do texto plano usa pass_cycle[j % len(pass_cycle)], exceto nas posições
+        inválidas (descartadas); depois o salt é inserido na ordem registrada.
+        Com salt_table_range, o salt é gravado só como quantidade e faixa de
+        passes, e a descriptografia repete o sorteio a partir da seed.
+        
+        Returns:
+            Tupla contendo (ciclo_formatado, chave_polida, chave_detalhada)
+        """
+        if not salt_inserts:
+            salt_flag = self.SALT_NONE
+            poli_salt = []
+        elif salt_table_range is not None:
+            salt_flag = self.SALT_FROM_SEED
+            poli_salt = [str(salt_table_range[0]).zfill(3) + str(salt_table_range[1]).zfill(3)]
+        else:
+            salt_flag = self.SALT_EXPLICIT
+            poli_salt = [self._counted(pos) + str(passe).zfill(3) for pos, passe in salt_inserts]
+        header = self.KEY_MARKER + self.KEY_VERSION_CYCLE + salt_flag
+        
+        poli_cycle = [str(p).zfill(3) for p in pass_cycle]
+        poli_invalid = [self._counted(pos) for pos in invalid_positions]
+        seed_value = self._counted(current_seed)
+        
+        if self.debug_mode:
+            seed_value = self._color_codes["blu"] + seed_value + self._color_codes["pad"]
+            poli_cycle = [self._color_codes["gre"] + p + self._color_codes["pad"] for p in poli_cycle]
+            poli_salt = [self._color_codes["red"] + p + self._color_codes["pad"] for p in poli_salt]
+            poli_invalid = [self._color_codes["yel"] + p + self._color_codes["pad"] for p in poli_invalid]
+        
+        # Gera chave detalhada (apenas para debug)
+        crude_key = (
+            f"\ncabeçalho: {header} (versão {self.KEY_VERSION_CYCLE})\n\n"
+            f"seed principal: {seed_value}\n\n"
+            f"salt ({len(salt_inserts)} itens, flag {salt_flag}): {', '.join(poli_salt)}\n\n"
+            f"comprimento do texto plano: {plaintext_length}\n\n"
+            f"ciclo de passes: {', '.join(poli_cycle)}\n\n"
+            f"posições inválidas: {', '.join(poli_invalid)}\n\n"
+            f"ct_len_before_padding: {ct_len_before_padding}\n\n"
+            f"padding: {padding}"
+        )
+        
+        # Gera chave polida (para uso real)
+        polished_key = "".join([
+            header,
+            self._counted(len(salt_inserts)) if salt_inserts else "",
+            "".join(poli_salt),
+            self._counted(plaintext_length),
+            self._counted(len(pass_cycle)),
+            "".join(poli_cycle),
+            self._counted(len(invalid_positions)),
+            "".join(poli_invalid),
+            self._counted(ct_len_before_padding),
+            seed_value,
+            padding,
+        ])
+        
+        return (poli_cycle, polished_key, crude_key)
+    
+    @staticmethod
+    def _counted(value: int) -> str:
+        """Formata um inteiro precedido pelo seu número de dígitos (3 dígitos)."""
+        digits = str(value)
+        return str(len(digits)).zfill(3) + digits
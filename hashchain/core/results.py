@@ -0,0 +1,58 @@
+"""Resultados imutáveis das operações de criptografia e descriptografia."""
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class EncryptResult:
+    """
+    Resultado de uma criptografia.
+    
+    Attributes:
+        ciphertext: Ciphertext entregue (comprimido se compress_text)
+        key: Chave de descriptografia
+        compressed: Ciphertext comprimido com o codec escolhido
+        raw_ciphertext: Ciphertext binário, sem compressão
+        plaintext: Texto original
+        passes: Passes usados
+        seed: Seed principal
+        invalid_characters: Caracteres fora do alfabeto, ignorados na substituição
+    """
+    
+    ciphertext: str
+    key: str
+    compressed: Optional[str]
+    raw_ciphertext: str
+    plaintext: str
+    passes: Tuple[int, ...]
+    seed: int
+    invalid_characters: Tuple[str, ...] = ()
+    
+    def as_info(self) -> List:
+        """Valores na ordem de HashChain.info() (0: compressed ... 5: seed)."""
+        return [
+            self.compressed,
+            self.key,
+            self.raw_ciphertext,
+            self.plaintext,
+            list(self.passes),
+            self.seed,
+        ]
+
+
+@dataclass(frozen=True, slots=True)
+class DecryptResult:
+    """
+    Resultado de uma descriptografia.
+    
+    Attributes:
+        plaintext: Texto descriptografado
+        key: Chave usada
+        passes: Passes lidos da chave
+        seed: Seed lida da chave
+    """
+    
+    plaintext: str
+    key: str
+    passes: Tuple[int, ...]
+    seed: int
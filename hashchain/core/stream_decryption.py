@@ -0,0 +1,285 @@
+"""Módulo de descriptografia incremental (streaming)."""
+import re
+from typing import BinaryIO, Dict, Iterator, List, Optional, TextIO, Tuple, Union
+
+from ..tables import TableCache, shared_table_cache
+from .compression import Compression, Decompressor, PackedTextDecoder
+from .decryption import Decryption
+from .encryption import Encryption
+
+
+class StreamDecryptor:
+    """
+    Descriptografa ciphertext recebido em partes, com a chave lida uma única vez.
+    
+    Cada segmento é decodificado assim que seus bits chegam. Em chaves v2 o
+    passe de cada segmento é calculado sob demanda a partir do ciclo e das
+    posições inválidas guardados na chave; sem salt (chaves do
+    StreamEncryptor), a memória usada não depende do tamanho da mensagem.
+    Com salt, a inicialização calcula o índice final de cada item de salt
+    (com uma árvore de Fenwick do tamanho da mensagem, descartada em
+    seguida) e guarda esses índices, percorridos com um ponteiro: a memória
+    é proporcional à quantidade de salt, que a criptografia sorteia entre 20
+    e 20 + segmentos. Chaves v1 e legadas já listam um passe por segmento.
+    Aceita ciphertext comprimido ou não: o texto empacotado (base64/base85) é
+    reconhecido pelo cabeçalho, e a descompressão RLE não altera texto que já
+    é binário.
+    """
+    
+    def __init__(
+        self,
+        key: str,
+        table_cache: Optional[TableCache] = None,
+        max_length: Optional[int] = None,
+        max_salted_segments: Optional[int] = None,
+    ):
+        """
+        Inicializa o descriptografador incremental.
+        
+        A chave é lida antes de qualquer ciphertext, então os comprimentos que
+        ela declara não podem ser conferidos com o texto recebido; os limites
+        rejeitam chaves cuja leitura custaria mais do que o esperado.
+        
+        Args:
+            key: Chave de descriptografia
+            table_cache: Cache de tabelas (opcional, usa o cache compartilhado do processo)
+            max_length: Limite para o comprimento declarado e a quantidade de
+                caracteres da chave (opcional)
+            max_salted_segments: Limite de segmentos (mensagem + salt) de chaves
+                com salt, cujo salt é reconstruído aqui (opcional)
+        
+        Raises:
+            ValueError: Se a chave for inválida ou acima dos limites
+        """
+        key = Decryption._remove_ansi(key or "")
+        if not key:
+            raise ValueError("key ausente. Forneça um valor válido.")
+        
+        self.table_cache = table_cache if table_cache is not None else shared_table_cache
+        
+        fields = Decryption()._read_key(
+            key, expand=False, max_length=max_length, max_salted_segments=max_salted_segments
+        )
+        self.seed: int = fields["seed"]
+        
+        if fields.get("passes") is None:
+            used = fields["pass_cycle"][:fields["plaintext_length"]] + fields["salt_passes"]
+            self._segments = self._cycle_segments(fields)
+        else:
+            used = fields["passes"]
+            self._segments = self._listed_segments(fields)
+        
+        self._tables: Dict[int, Dict[str, str]] = {}
+        for passe in dict.fromkeys(used):
+            self._tables[passe] = self.table_cache.get(self.seed * 1000000 + passe, passe)[1].copy()
+        
+        self._decoder: Optional[Union[Decompressor, PackedTextDecoder]] = None
+        self._buffer = ""
+        self._current = next(self._segments, None)
+        self._finalized = False
+    
+    @staticmethod
+    def _cycle_segments(fields: Dict) -> Iterator[Tuple[int, bool]]:
+        """
+        Gera (passe, é_salt) de cada segmento de uma chave v2, na ordem do ciphertext.
+        
+        O passe da posição j do texto é pass_cycle[j % len(pass_cycle)]; as
+        posições inválidas e os índices finais do salt, ambos ordenados, são
+        percorridos com ponteiros.
+        
+        Args:
+            fields: Campos lidos da chave sem expandir os passes
+        
+        Yields:
+            Tuplas (passe, é_salt)
+        """
+        pass_cycle = fields["pass_cycle"]
+        plaintext_length = fields["plaintext_length"]
+        salt_passes = fields["salt_passes"]
+        
+        salt: Iterator[Tuple[int, int]] = iter(())
+        if salt_passes:
+            total = plaintext_length - len(fields["invalid_positions"]) + len(salt_passes)
+            final_indices = Encryption._final_insert_indices(fields["posicoes"], total)
+            salt = iter(sorted(zip(final_indices, salt_passes)))
+        next_salt = next(salt, None)
+        
+        invalid = iter(fields["invalid_positions"])
+        next_invalid = next(invalid, plaintext_length)
+        n_cycle = len(pass_cycle)
+        idx = 0
+        
+        for pos in range(plaintext_length):
+            if pos == next_invalid:
+                next_invalid = next(invalid, plaintext_length)
+                continue
+            while next_salt is not None and next_salt[0] == idx:
+                yield next_salt[1], True
+                next_salt = next(salt, None)
+                idx += 1
+            yield pass_cycle[pos % n_cycle], False
+            idx += 1
+        
+        while next_salt is not None:
+            yield next_salt[1], True
+            next_salt = next(salt, None)
+    
+    @staticmethod
+    def _listed_segments(fields: Dict) -> Iterator[Tuple[int, bool]]:
+        """
+        Gera (passe, é_salt) de cada segmento de uma chave v1 ou legada.
+        
+        Args:
+            fields: Campos lidos da chave (passes já incluem o salt)
+        
+        Yields:
+            Tuplas (passe, é_salt)
+        """
+        passes = fields["passes"]
+        salt_indices = iter(StreamDecryptor._salt_segment_indices(fields, len(passes)))
+        next_salt = next(salt_indices, None)
+        for idx, passe in enumerate(passes):
+            is_salt = idx == next_salt
+            if is_salt:
+                next_salt = next(salt_indices, None)
+            yield passe, is_salt
+    
+    @staticmethod
+    def _salt_segment_indices(fields: Dict, total: int) -> List[int]:
+        """
+        Converte as posições de inserção do salt nos índices finais dos segmentos.
+        
+        Args:
+            fields: Campos lidos da chave
+            total: Quantidade total de segmentos (mensagem + salt)
+        
+        Returns:
+            Índices dos segmentos de salt, em ordem crescente
+        """
+        posicoes = fields["posicoes"]
+        if fields["salt_flag"] != "1" or not posicoes:
+            return []
+        
+        base = total - len(posicoes)
+        for k, pos in enumerate(posicoes):
+            if not 0 <= pos < base + k:
+                raise ValueError("Chave inválida: posição de salt fora do intervalo")
+        
+        return sorted(Encryption._final_insert_indices(posicoes, total))
+    
+    def feed(self, chunk: Union[str, bytes]) -> str:
+        """
+        Processa a próxima parte do ciphertext.
+        
+        Args:
+            chunk: Próxima parte do ciphertext (texto ou bytes ASCII)
+        
+        Returns:
+            Plaintext dos segmentos completados por esta parte
+        
+        Raises:
+            ValueError: Se já foi finalizado ou o ciphertext for inválido
+        """
+        if self._finalized:
+            raise ValueError("StreamDecryptor já finalizado")
+        
+        if isinstance(chunk, (bytes, bytearray)):
+            chunk = chunk.decode("ascii")
+        
+        chunk = self._clean_chunk(chunk)
+        if not chunk:
+            return ""
+        
+        # O codec é escolhido pelo início do ciphertext
+        if self._decoder is None:
+            if Compression.is_packed_text(chunk):
+                self._decoder = PackedTextDecoder()
+            else:
+                self._decoder = Decompressor()
+        
+        return self._consume(self._decoder.feed(chunk))
+    
+    def _consume(self, bits: str) -> str:
+        """Decodifica os segmentos completados pelos novos bits."""
+        self._buffer += bits
+        
+        plaintext = []
+        ptr = 0
+        current = self._current
+        buffer_length = len(self._buffer)
+        
+        while current is not None and buffer_length - ptr >= current[0]:
+            passe, is_salt = current
+            if not is_salt:
+                char = self._tables[passe].get(self._buffer[ptr:ptr + passe])
+                if char is not None:
+                    plaintext.append(char)
+            ptr += passe
+            current = next(self._segments, None)
+        
+        self._current = current
+        # Após o último segmento restam apenas bits de padding, que são descartados
+        self._buffer = self._buffer[ptr:] if current is not None else ""
+        
+        return "".join(plaintext)
+    
+    def finalize(self) -> str:
+        """
+        Encerra a descriptografia.
+        
+        Returns:
+            Plaintext restante (dos últimos bits retidos pelo decodificador)
+        
+        Raises:
+            ValueError: Se o ciphertext terminou antes do comprimento declarado
+        """
+        if self._finalized:
+            raise ValueError("StreamDecryptor já finalizado")
+        
+        plaintext = self._consume(self._decoder.flush()) if self._decoder is not None else ""
+        self._finalized = True
+        
+        if self._current is not None:
+            raise ValueError("Ciphertext menor que o comprimento declarado")
+        
+        return plaintext
+    
+    def decrypt_stream(
+        self,
+        source: Union[TextIO, BinaryIO],
+        destination: TextIO,
+        block_size: int = 1 << 20,
+    ) -> int:
+        """
+        Lê o ciphertext de um arquivo em blocos e escreve o plaintext em outro.
+        
+        Args:
+            source: Objeto de arquivo com o ciphertext (modo texto ou binário)
+            destination: Objeto de arquivo de texto para o plaintext
+            block_size: Tamanho de cada leitura
+        
+        Returns:
+            Quantidade de caracteres escritos
+        """
+        written = 0
+        
+        while True:
+            block = source.read(block_size)
+            if not block:
+                break
+            plaintext = self.feed(block)
+            if plaintext:
+                destination.write(plaintext)
+                written += len(plaintext)
+        
+        plaintext = self.finalize()
+        if plaintext:
+            destination.write(plaintext)
+            written += len(plaintext)
+        
+        return written
+    
+    @staticmethod
+    def _clean_chunk(s: str) -> str:
+        """Remove sequências ANSI e espaços em branco de uma parte do ciphertext."""
+        return re.sub(r"\x1b\[[0-9;]*m|\s", "", s)
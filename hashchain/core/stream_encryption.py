@@ -0,0 +1,180 @@
+"""Módulo de criptografia incremental (streaming)."""
+import random
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..tables import TableCache, shared_table_cache
+from .compression import Compressor
+from .encryption import Encryption
+from .key_generator import KeyGenerator
+
+
+class StreamEncryptor:
+    """
+    Criptografa texto recebido em partes, com memória limitada ao tamanho de cada parte.
+    
+    A saída concatenada de feed() e finalize() é idêntica ao ciphertext de
+    Encryption.encrypt(..., no_salt=True), comprimido ou não conforme
+    compress_text, e a chave também.
+    O salt não é suportado: as posições sorteadas abrangem a mensagem inteira.
+    """
+    
+    def __init__(
+        self,
+        pass_: Optional[List[int]] = None,
+        seed: int = 0,
+        min_table_leng: int = 20,
+        max_table_leng: int = 999,
+        table_cache: Optional[TableCache] = None,
+        compress_text: bool = False,
+    ):
+        """
+        Inicializa o criptografador incremental.
+        
+        Args:
+            pass_: Lista de passes (opcional, sem ela cada caractere recebe um passe aleatório)
+            seed: Seed para geração determinística (opcional)
+            min_table_leng: Tamanho mínimo da tabela (mínimo 20)
+            max_table_leng: Tamanho máximo da tabela (máximo 999)
+            table_cache: Cache de tabelas (opcional, usa o cache compartilhado do processo)
+            compress_text: Se True, comprime o ciphertext à medida que é gerado
+        """
+        if min_table_leng < 20:
+            min_table_leng = 20
+        
+        self.min_table_leng = min_table_leng
+        self.max_table_leng = max_table_leng
+        self.table_cache = table_cache if table_cache is not None else shared_table_cache
+        self.key_generator = KeyGenerator()
+        
+        self.seed = seed or Encryption._generate_random_seed(64)
+        self.auto_passes = not pass_
+        self.passes: List[int] = [] if self.auto_passes else list(pass_)
+        self.invalid_characters: List[str] = []
+        self.key: Optional[str] = None
+        
+        self._tables: Dict[int, Dict[str, str]] = {}
+        self._invalid_positions: List[int] = []
+        self._position = 0
+        self._ct_len = 0
+        self._finalized = False
+        self._compressor = Compressor() if compress_text else None
+        
+        self._load_tables(self.passes)
+    
+    def _load_tables(self, passes: Iterable[int]) -> None:
+        """Garante as tabelas dos tamanhos de passe ainda não carregados."""
+        for passe in dict.fromkeys(passes):
+            if passe not in self._tables:
+                self._tables[passe] = self.table_cache.get(self.seed * 1000000 + passe, passe)[0].copy()
+    
+    def feed(self, chunk: str) -> str:
+        """
+        Criptografa a próxima parte do texto.
+        
+        Args:
+            chunk: Próxima parte do texto plano
+        
+        Returns:
+            Ciphertext correspondente à parte (comprimido se compress_text)
+        
+        Raises:
+            ValueError: Se o criptografador já foi finalizado
+        """
+        if self._finalized:
+            raise ValueError("StreamEncryptor já finalizado")
+        
+        if not chunk:
+            return ""
+        
+        if self.auto_passes:
+            # Sem ciclo: cada caractere recebe um passe novo, como em Encryption.encrypt
+            chunk_passes = [
+                random.randint(self.min_table_leng, self.max_table_leng) for _ in range(len(chunk))
+            ]
+            self.passes.extend(chunk_passes)
+            self._load_tables(chunk_passes)
+        else:
+            # Rotaciona o ciclo para continuar de onde a parte anterior parou
+            offset = self._position % len(self.passes)
+            chunk_passes = self.passes[offset:] + self.passes[:offset]
+        
+        codes, _, invalid = Encryption._substitute(chunk, chunk_passes, self._tables)
+        
+        if invalid:
+            alphabet = self._tables[chunk_passes[0]]
+            self._invalid_positions.extend(
+                self._position + pos for pos in Encryption._invalid_positions(chunk, alphabet)
+            )
+        
+        self._position += len(chunk)
+        self.invalid_characters.extend(invalid)
+        
+        ciphertext = "".join(codes)
+        self._ct_len += len(ciphertext)
+        
+        if self._compressor is not None:
+            return self._compressor.feed(ciphertext)
+        return ciphertext
+    
+    def finalize(self) -> Tuple[str, str]:
+        """
+        Encerra a criptografia, gerando o padding e a chave.
+        
+        Returns:
+            Tupla contendo (ciphertext_final, key)
+        
+        Raises:
+            ValueError: Se nenhum texto foi fornecido ou se já foi finalizado
+        """
+        if self._finalized:
+            raise ValueError("StreamEncryptor já finalizado")
+        
+        if not self._position:
+            raise ValueError("Parâmetro obrigatório: plaintext deve ser uma string não vazia")
+        
+        self._finalized = True
+        
+        # A chave guarda só o ciclo de passes e as posições inválidas (formato de ciclo)
+        if (self._ct_len % 20) == 0:
+            padding = 0
+        else:
+            padding = ((self._ct_len % 20) - 20) * -1
+        tail = padding * "1"
+        
+        key_result = self.key_generator.generate(
+            passes_list=[],
+            current_seed=self.seed,
+            padding=str(padding) if padding else "",
+            ct_len_before_padding=self._ct_len,
+            pass_cycle=self.passes,
+            plaintext_length=self._position,
+            invalid_positions=self._invalid_positions,
+        )
+        
+        self.key = key_result[1]
+        
+        if self._compressor is not None:
+            tail = self._compressor.feed(tail) + self._compressor.flush()
+        
+        return tail, self.key
+    
+    def iter_encrypt(self, chunks: Iterable[str]) -> Iterator[str]:
+        """
+        Criptografa um iterável de partes, produzindo o ciphertext à medida que avança.
+        
+        A chave fica disponível em self.key ao final da iteração.
+        
+        Args:
+            chunks: Partes do texto plano (ex: linhas de um arquivo)
+        
+        Yields:
+            Partes do ciphertext
+        """
+        for chunk in chunks:
+            ciphertext = self.feed(chunk)
+            if ciphertext:
+                yield ciphertext
+        
+        tail, _ = self.finalize()
+        if tail:
+            yield tail
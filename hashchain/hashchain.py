@@ -1,7 +1,10 @@
 """Classe principal HashChain que integra todos os módulos."""
-from typing import List, Optional, Dict, Tuple
+from typing import List, Optional, Dict, Tuple, Union
 
-from .core import Encryption, Decryption, Compression
+from .core import (
+    Encryption, Decryption, Compression, StreamEncryptor, StreamDecryptor,
+    EncryptResult, DecryptResult,
+)
 from .core.key_generator import KeyGenerator
 
 
@@ -15,6 +18,200 @@ class HashChain:
         self._compression = Compression()
         self._info: List[Optional[str]] = [None, None, None, None, None, None]
     
+    def encrypt_text(
+        self,
+        plaintext: str,
+        pass_: Optional[List[int]] = None,
+        seed: int = 0,
+        no_salt: bool = False,
+        debug_mode: bool = False,
+        min_table_leng: int = 20,
+        max_table_leng: int = 999,
+        compress_text: bool = True,
+        workers: int = 1,
+        codec: str = "rle",
+        codec_policy: str = "smallest",
+    ) -> EncryptResult:
+        """
+        Criptografa texto sem guardar estado na instância.
+        
+        Pode ser chamado por várias threads na mesma instância.
+        
+        Args:
+            plaintext: Texto a ser criptografado
+            pass_: Lista de passes (opcional)
+            seed: Seed para geração determinística (opcional)
+            no_salt: Se True, não usa salt
+            debug_mode: Se True, imprime informações de debug
+            min_table_leng: Tamanho mínimo da tabela (mínimo 20)
+            max_table_leng: Tamanho máximo da tabela (máximo 999)
+            compress_text: Se True, comprime o texto cifrado
+            workers: Número de processos para a substituição (1 = sem paralelismo)
+            codec: Codec de texto da compressão: "rle" (padrão), "base64", "base85",
+                "zlib", "lzma" ou "adaptive" (melhor codec por bloco)
+            codec_policy: Política do modo adaptativo: "smallest" (padrão) ou "fastest"
+            
+        Returns:
+            EncryptResult com ciphertext, chave e metadados
+        """
+        encryption = Encryption(debug_mode=True) if debug_mode else self._encryption
+        
+        ciphertext, key, info_dict = encryption.encrypt(
+            plaintext=plaintext,
+            pass_=pass_,
+            seed=seed,
+            no_salt=no_salt,
+            min_table_leng=min_table_leng,
+            max_table_leng=max_table_leng,
+            compress_text=compress_text,
+            workers=workers,
+            codec=codec,
+            codec_policy=codec_policy,
+        )
+        
+        return EncryptResult(
+            ciphertext=ciphertext,
+            key=key,
+            compressed=info_dict["compressed"],
+            raw_ciphertext=info_dict["ciphertext"],
+            plaintext=info_dict["plaintext"],
+            passes=tuple(info_dict["passes"]),
+            seed=info_dict["seed"],
+            invalid_characters=tuple(info_dict["invalid_characters"]),
+        )
+    
+    def decrypt_text(self, ciphertext: str, key: str, workers: int = 1) -> DecryptResult:
+        """
+        Descriptografa texto cifrado sem guardar estado na instância.
+        
+        Pode ser chamado por várias threads na mesma instância.
+        
+        Args:
+            ciphertext: Texto cifrado (comprimido ou não)
+            key: Chave de descriptografia
+            workers: Número de processos para decodificar os segmentos (1 = sem paralelismo)
+            
+        Returns:
+            DecryptResult com o plaintext e os dados lidos da chave
+            
+        Raises:
+            ValueError: Se o ciphertext ou a chave estiverem ausentes ou forem inválidos
+        """
+        if not ciphertext or not key:
+            raise ValueError("ciphertext e/ou key ausentes. Forneça valores válidos.")
+        
+        plaintext, info_dict = self._decryption.decrypt(
+            ciphertext=ciphertext,
+            key=key,
+            started_with_compressed=None,
+            workers=workers,
+        )
+        
+        return DecryptResult(
+            plaintext=plaintext,
+            key=key,
+            passes=tuple(info_dict["passes"]),
+            seed=info_dict["seed"],
+        )
+    
+    def encrypt_batch(
+        self,
+        items: List[Dict],
+        pass_: Optional[List[int]] = None,
+        seed: int = 0,
+        no_salt: bool = False,
+        compress_text: bool = True,
+        codec: str = "rle",
+    ) -> List[Union[EncryptResult, ValueError]]:
+        """
+        Criptografa vários textos, com o resultado ou o erro de cada item.
+        
+        Os itens são processados em sequência; as tabelas vêm do cache
+        compartilhado, então itens com a mesma seed e passes reaproveitam as
+        tabelas já construídas. Itens sem seed recebem uma seed aleatória
+        própria, como em encrypt_text().
+        
+        Args:
+            items: Itens com "plaintext" e, opcionalmente, "seed", "passes" e "no_salt" próprios
+            pass_: Passes compartilhados pelos itens que não definem os seus (opcional)
+            seed: Seed compartilhada pelos itens que não definem a sua (opcional)
+            no_salt: Valor padrão de no_salt
+            compress_text: Se True, comprime o texto cifrado
+            codec: Codec de texto da compressão
+            
+        Returns:
+            Lista na ordem dos itens, com o EncryptResult ou o ValueError de cada item
+            (inclusive para itens com campos de tipo inválido)
+        """
+        results: List[Union[EncryptResult, ValueError]] = []
+        for item in items:
+            try:
+                self._check_batch_item(item, ("plaintext",))
+                item_passes = item.get("passes") or pass_
+                results.append(self.encrypt_text(
+                    plaintext=item.get("plaintext", ""),
+                    pass_=list(item_passes) if item_passes else None,
+                    seed=item.get("seed") or seed,
+                    no_salt=item.get("no_salt", no_salt),
+                    compress_text=compress_text,
+                    codec=codec,
+                ))
+            except ValueError as e:
+                results.append(e)
+        
+        return results
+    
+    def decrypt_batch(self, items: List[Dict]) -> List[Union[DecryptResult, ValueError]]:
+        """
+        Descriptografa vários textos, com o resultado ou o erro de cada item.
+        
+        Args:
+            items: Itens com "ciphertext" e "key"
+            
+        Returns:
+            Lista na ordem dos itens, com o DecryptResult ou o ValueError de cada item
+            (inclusive para itens com campos de tipo inválido)
+        """
+        results: List[Union[DecryptResult, ValueError]] = []
+        for item in items:
+            try:
+                self._check_batch_item(item, ("ciphertext", "key"))
+                results.append(self.decrypt_text(item.get("ciphertext", ""), item.get("key", "")))
+            except ValueError as e:
+                results.append(e)
+        
+        return results
+    
+    @staticmethod
+    def _check_batch_item(item: Dict, text_fields: Tuple[str, ...]) -> None:
+        """
+        Confere os tipos dos campos de um item de lote antes de processá-lo.
+        
+        Args:
+            item: Item do lote
+            text_fields: Campos que, se presentes, devem ser texto
+            
+        Raises:
+            ValueError: Se o item não for um dicionário ou tiver campo de tipo inválido
+        """
+        if not isinstance(item, dict):
+            raise ValueError("Item inválido: deve ser um dicionário")
+        for field in text_fields:
+            if not isinstance(item.get(field, ""), str):
+                raise ValueError(f"Item inválido: '{field}' deve ser texto")
+        
+        seed = item.get("seed")
+        if seed is not None and (not isinstance(seed, int) or isinstance(seed, bool)):
+            raise ValueError("Item inválido: 'seed' deve ser um inteiro")
+        passes = item.get("passes")
+        if passes is not None and (
+            not isinstance(passes, (list, tuple))
+            or not all(isinstance(p, int) and not isinstance(p, bool) for p in passes)
+        ):
+            raise ValueError("Item inválido: 'passes' deve ser uma lista de inteiros")
+        if not isinstance(item.get("no_salt", False), bool):
+            raise ValueError("Item inválido: 'no_salt' deve ser true ou false")
+    
     def encrypt(
         self,
         plaintext: str,
@@ -27,9 +224,14 @@ class HashChain:
         compress_text: bool = True,
         retonar: bool = False,
         printar: bool = False,
+        workers: int = 1,
+        codec: str = "rle",
+        codec_policy: str = "smallest",
     ) -> Optional[List[str]]:
         """
-        Criptografa texto utilizando tabelas de substituição.
+        Criptografa texto e guarda o resultado para info()/out() (compatibilidade).
+        
+        Prefira encrypt_text(), que não guarda estado e pode ser usado por várias threads.
         
         Args:
             plaintext: Texto a ser criptografado
@@ -42,38 +244,36 @@ class HashChain:
             compress_text: Se True, comprime o texto cifrado
             retonar: Se True, retorna [ciphertext, key]
             printar: Se True, imprime resultados
+            workers: Número de processos para a substituição (1 = sem paralelismo)
+            codec: Codec de texto da compressão: "rle" (padrão), "base64", "base85",
+                "zlib", "lzma" ou "adaptive" (melhor codec por bloco)
+            codec_policy: Política do modo adaptativo: "smallest" (padrão) ou "fastest"
             
         Returns:
             Lista [ciphertext, key] se retonar=True, None caso contrário
         """
-        if debug_mode:
-            self._encryption = Encryption(debug_mode=True)
-        
-        ciphertext, key, info_dict = self._encryption.encrypt(
+        result = self.encrypt_text(
             plaintext=plaintext,
             pass_=pass_,
             seed=seed,
             no_salt=no_salt,
+            debug_mode=debug_mode,
             min_table_leng=min_table_leng,
             max_table_leng=max_table_leng,
             compress_text=compress_text,
+            workers=workers,
+            codec=codec,
+            codec_policy=codec_policy,
         )
         
-        self._info = [
-            info_dict["compressed"],  # 0: texto comprimido
-            key,  # 1: chave
-            info_dict["ciphertext"],  # 2: texto cifrado não comprimido
-            info_dict["plaintext"],  # 3: texto original
-            info_dict["passes"],  # 4: passes
-            info_dict["seed"],  # 5: seed
-        ]
+        self._info = result.as_info()
         
         if printar:
-            print(f"Ciphertext:\n{ciphertext}")
-            print(f"\nKey:\n{key}")
+            print(f"Ciphertext:\n{result.ciphertext}")
+            print(f"\nKey:\n{result.key}")
         
         if retonar:
-            return [info_dict["ciphertext"], key]
+            return [result.raw_ciphertext, result.key]
         
         return None
     
@@ -83,15 +283,19 @@ class HashChain:
         key: Optional[str] = None,
         printar: bool = False,
         retonar: bool = False,
+        workers: int = 1,
     ) -> Optional[str]:
         """
-        Descriptografa texto cifrado usando a chave fornecida.
+        Descriptografa texto cifrado e guarda o resultado para info()/out() (compatibilidade).
+        
+        Prefira decrypt_text(), que não guarda estado e pode ser usado por várias threads.
         
         Args:
             ciphertext: Texto cifrado (opcional, usa self._info se não fornecido)
             key: Chave de descriptografia (opcional, usa self._info se não fornecido)
             printar: Se True, imprime o resultado
             retonar: Se True, retorna o plaintext
+            workers: Número de processos para decodificar os segmentos (1 = sem paralelismo)
             
         Returns:
             Plaintext se retonar=True, None caso contrário
@@ -108,25 +312,138 @@ class HashChain:
                 "ciphertext e/ou key ausentes. Gere com encrypt ou forneça valores válidos."
             )
         
-        plaintext, info_dict = self._decryption.decrypt(
-            ciphertext=ciphertext,
-            key=key,
-            started_with_compressed=None,
-        )
-        
-        self._info[3] = plaintext
-        self._info[1] = key
-        self._info[4] = info_dict["passes"]
-        self._info[5] = info_dict["seed"]
+        result = self.decrypt_text(ciphertext, key, workers=workers)
+        self._store_decrypt(result)
         
         if printar:
-            print(f"Plaintext:\n{plaintext}")
+            print(f"Plaintext:\n{result.plaintext}")
         
         if retonar:
-            return plaintext
+            return result.plaintext
         
         return None
     
+    def _store_decrypt(self, result: DecryptResult) -> None:
+        """Guarda o resultado de uma descriptografia para info()/out()."""
+        self._info[3] = result.plaintext
+        self._info[1] = result.key
+        self._info[4] = list(result.passes)
+        self._info[5] = result.seed
+    
+    def encrypt_bytes(
+        self,
+        plaintext: str,
+        pass_: Optional[List[int]] = None,
+        seed: int = 0,
+        no_salt: bool = False,
+        min_table_leng: int = 20,
+        max_table_leng: int = 999,
+        workers: int = 1,
+    ) -> Tuple[bytes, str]:
+        """
+        Criptografa texto e retorna o ciphertext empacotado em bytes (8 bits por byte).
+        
+        Args:
+            plaintext: Texto a ser criptografado
+            pass_: Lista de passes (opcional)
+            seed: Seed para geração determinística (opcional)
+            no_salt: Se True, não usa salt
+            min_table_leng: Tamanho mínimo da tabela (mínimo 20)
+            max_table_leng: Tamanho máximo da tabela (máximo 999)
+            workers: Número de processos para a substituição (1 = sem paralelismo)
+            
+        Returns:
+            Tupla (ciphertext_bytes, key)
+        """
+        ciphertext, key, info_dict = self._encryption.encrypt_bytes(
+            plaintext=plaintext,
+            pass_=pass_,
+            seed=seed,
+            no_salt=no_salt,
+            min_table_leng=min_table_leng,
+            max_table_leng=max_table_leng,
+            workers=workers,
+        )
+        
+        self._info = [
+            None,  # 0: texto comprimido (não gerado no formato bytes)
+            key,  # 1: chave
+            ciphertext,  # 2: ciphertext empacotado
+            info_dict["plaintext"],  # 3: texto original
+            info_dict["passes"],  # 4: passes
+            info_dict["seed"],  # 5: seed
+        ]
+        
+        return ciphertext, key
+    
+    def decrypt_bytes(self, ciphertext: bytes, key: str, workers: int = 1) -> str:
+        """
+        Descriptografa ciphertext empacotado em bytes.
+        
+        Args:
+            ciphertext: Ciphertext gerado por encrypt_bytes
+            key: Chave de descriptografia
+            workers: Número de processos para decodificar os segmentos (1 = sem paralelismo)
+            
+        Returns:
+            Plaintext
+        """
+        plaintext, info_dict = self._decryption.decrypt_bytes(
+            ciphertext=ciphertext, key=key, workers=workers
+        )
+        
+        self._store_decrypt(
+            DecryptResult(plaintext, key, tuple(info_dict["passes"]), info_dict["seed"])
+        )
+        
+        return plaintext
+    
+    def stream_encryptor(
+        self,
+        pass_: Optional[List[int]] = None,
+        seed: int = 0,
+        min_table_leng: int = 20,
+        max_table_leng: int = 999,
+        compress_text: bool = False,
+    ) -> StreamEncryptor:
+        """
+        Cria um criptografador incremental (feed/finalize) para entradas grandes.
+        
+        O ciphertext gerado não leva salt.
+        
+        Args:
+            pass_: Lista de passes (opcional)
+            seed: Seed para geração determinística (opcional)
+            min_table_leng: Tamanho mínimo da tabela (mínimo 20)
+            max_table_leng: Tamanho máximo da tabela (máximo 999)
+            compress_text: Se True, comprime o ciphertext à medida que é gerado
+            
+        Returns:
+            Instância de StreamEncryptor
+        """
+        return StreamEncryptor(
+            pass_=pass_,
+            seed=seed,
+            min_table_leng=min_table_leng,
+            max_table_leng=max_table_leng,
+            compress_text=compress_text,
+        )
+    
+    def decrypt_stream(self, source, destination, key: str, block_size: int = 1 << 20) -> int:
+        """
+        Descriptografa um ciphertext lido de um arquivo em blocos, escrevendo o plaintext em outro.
+        
+        Args:
+            source: Objeto de arquivo com o ciphertext (comprimido ou não)
+            destination: Objeto de arquivo de texto para o plaintext
+            key: Chave de descriptografia
+            block_size: Tamanho de cada leitura
+            
+        Returns:
+            Quantidade de caracteres escritos
+        """
+        return StreamDecryptor(key).decrypt_stream(source, destination, block_size=block_size)
+    
     def compression(self, cipher_text: str, printar: bool = False) -> Optional[str]:
         """
         Comprime texto binário.
@@ -149,7 +466,10 @@ class HashChain:
             printar: Se True, imprime o resultado
             
         Returns:
-            Texto descomprimido ou mensagem de erro
+            Texto descomprimido
+            
+        Raises:
+            DecompressionError: Se o texto comprimido contiver caracteres inválidos
         """
         return self._compression.decompress(compressed_cipher_text, print_output=printar)
     
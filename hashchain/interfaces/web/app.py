@@ -1,17 +1,183 @@
 """Interface web para HashChain usando Flask."""
 try:
-    from flask import Flask, render_template, request, jsonify
+    from flask import Flask, Response, render_template, request, jsonify, stream_with_context
     FLASK_AVAILABLE = True
 except ImportError:
     FLASK_AVAILABLE = False
     # Não imprime mensagem aqui para não poluir o output
 
 from hashchain import HashChain
+from hashchain.core import DecompressionError, StreamDecryptor
+from .jobs import JobManager, JobQueueFullError
+import codecs
 import secrets
+import threading
 
-# Instância global do HashChain
+# Instância global do HashChain (a API web usa apenas os métodos sem estado)
 hashchain = HashChain()
 
+# Limites padrão dos endpoints de lote (ajustáveis em app.config)
+BATCH_MAX_ITEMS = 1000
+BATCH_MAX_ITEM_LENGTH = 64 * 1024
+BATCH_MAX_TOTAL_LENGTH = 4 * 1024 * 1024
+
+# Padrões dos jobs assíncronos (ajustáveis em app.config antes do primeiro job)
+JOBS_MAX_WORKERS = 2
+JOBS_MAX_PENDING = 100
+JOBS_TTL = 600
+
+# Endpoints de streaming: tipos aceitos, tamanho das leituras e cabeçalho da chave
+STREAM_MIMETYPES = ('application/octet-stream', 'text/plain')
+STREAM_BLOCK_SIZE = 64 * 1024
+KEY_HEADER = 'X-HashChain-Key'
+
+# Limites da chave do streaming, lida antes do ciphertext: comprimento declarado
+# (bits) e segmentos de mensagens com salt, cujo salt é reconstruído na leitura
+STREAM_MAX_LENGTH = 1 << 33
+STREAM_MAX_SALTED_SEGMENTS = 1 << 17
+# Tamanho máximo da chave enviada na primeira linha do corpo
+STREAM_MAX_KEY_LENGTH = 1 << 20
+
+_job_manager = None
+_job_manager_lock = threading.Lock()
+
+
+def _get_job_manager(config):
+    """Cria o gerenciador de jobs no primeiro uso, com os limites de app.config."""
+    global _job_manager
+    with _job_manager_lock:
+        if _job_manager is None:
+            _job_manager = JobManager(
+                max_workers=config.get('JOBS_MAX_WORKERS', JOBS_MAX_WORKERS),
+                max_pending=config.get('JOBS_MAX_PENDING', JOBS_MAX_PENDING),
+                ttl=config.get('JOBS_TTL', JOBS_TTL),
+            )
+        return _job_manager
+
+
+def _parse_seed(seed):
+    """Converte a seed recebida (número ou texto) em int; vazia equivale a 0."""
+    if isinstance(seed, str):
+        if not seed:
+            return 0
+        try:
+            return int(seed)
+        except ValueError:
+            raise ValueError('Seed inválida')
+    if seed is None:
+        return 0
+    if not isinstance(seed, int) or isinstance(seed, bool):
+        raise ValueError('Seed inválida')
+    return seed
+
+
+def _parse_passes(passes):
+    """Converte os passes recebidos (lista ou texto separado por espaços) em lista de int."""
+    if isinstance(passes, str):
+        if not passes:
+            return None
+        try:
+            return [int(x) for x in passes.split()]
+        except ValueError:
+            raise ValueError('Passes inválidos')
+    if passes is None or passes == []:
+        return None
+    if not isinstance(passes, list) or not all(
+        isinstance(x, int) and not isinstance(x, bool) for x in passes
+    ):
+        raise ValueError('Passes inválidos')
+    return passes
+
+
+def _parse_flag(value, name):
+    """Exige um booleano JSON (true/false); textos como "false" não são aceitos."""
+    if not isinstance(value, bool):
+        raise ValueError(f"'{name}' deve ser true ou false")
+    return value
+
+
+def _read_blocks(stream, first=b''):
+    """Gera o bloco já lido (se houver) e os blocos restantes do corpo da requisição."""
+    if first:
+        yield first
+    while True:
+        block = stream.read(STREAM_BLOCK_SIZE)
+        if not block:
+            return
+        yield block
+
+
+def _split_key_line(stream, max_length=STREAM_MAX_KEY_LENGTH):
+    """
+    Lê o corpo até a primeira quebra de linha, que separa a chave do ciphertext.
+    
+    Args:
+        stream: Corpo da requisição
+        max_length: Tamanho máximo da linha da chave
+    
+    Returns:
+        Tupla (chave, início_do_ciphertext)
+    
+    Raises:
+        ValueError: Se a primeira linha passar de max_length bytes
+    """
+    head = bytearray()
+    while True:
+        block = stream.read(STREAM_BLOCK_SIZE)
+        newline = block.find(b'\n')
+        head += block if newline < 0 else block[:newline]
+        if len(head) > max_length:
+            raise ValueError(f'Chave maior que o limite de {max_length} bytes')
+        if not block:
+            return bytes(head).decode('ascii').strip(), b''
+        if newline >= 0:
+            return bytes(head).decode('ascii').strip(), block[newline + 1:]
+
+
+def _multipart_part(boundary, name):
+    """Cabeçalho de uma parte da resposta multipart/mixed."""
+    return (
+        f'--{boundary}\r\n'
+        f'Content-Type: text/plain; charset=ascii\r\n'
+        f'Content-Disposition: inline; name="{name}"\r\n\r\n'
+    )
+
+
+def _batch_items(data, text_field, config):
+    """
+    Valida o corpo de um lote e os limites de tamanho.
+    
+    Returns:
+        Tupla (itens, erros), onde erros mapeia o índice do item para a mensagem
+        de erro; ou (None, (mensagem, status)) se o lote inteiro for rejeitado
+    """
+    items = data.get('items') if isinstance(data, dict) else None
+    if not isinstance(items, list) or not items:
+        return None, ("Lote vazio ou inválido: envie 'items' como lista", 400)
+    
+    max_items = config.get('BATCH_MAX_ITEMS', BATCH_MAX_ITEMS)
+    if len(items) > max_items:
+        return None, (f'Lote com {len(items)} itens excede o limite de {max_items}', 413)
+    
+    max_item = config.get('BATCH_MAX_ITEM_LENGTH', BATCH_MAX_ITEM_LENGTH)
+    max_total = config.get('BATCH_MAX_TOTAL_LENGTH', BATCH_MAX_TOTAL_LENGTH)
+    total = 0
+    errors = {}
+    
+    for index, item in enumerate(items):
+        if not isinstance(item, dict) or not isinstance(item.get(text_field), str):
+            errors[index] = f"Item inválido: '{text_field}' deve ser texto"
+            continue
+        length = len(item[text_field])
+        total += length
+        if length > max_item:
+            errors[index] = f'Item com {length} caracteres excede o limite de {max_item}'
+    
+    if total > max_total:
+        return None, (f'Lote com {total} caracteres excede o limite de {max_total}', 413)
+    
+    return items, errors
+
 # Inicializa Flask se disponível
 if FLASK_AVAILABLE:
     import os
@@ -40,25 +206,14 @@ if FLASK_AVAILABLE:
             if not plaintext:
                 return jsonify({'error': 'Texto não fornecido'}), 400
             
-            # Converte seed se for string
-            if isinstance(seed, str):
-                if seed:
-                    try:
-                        seed = int(seed)
-                    except ValueError:
-                        return jsonify({'error': 'Seed inválida'}), 400
-                else:
-                    seed = 0
-            
-            # Converte passes se for string
-            if isinstance(passes, str) and passes:
-                try:
-                    passes = [int(x) for x in passes.split()]
-                except ValueError:
-                    return jsonify({'error': 'Passes inválidos'}), 400
+            try:
+                seed = _parse_seed(seed)
+                passes = _parse_passes(passes)
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
             
-            # Criptografa
-            hashchain.encrypt(
+            # Criptografa (sem estado compartilhado entre requisições)
+            result = hashchain.encrypt_text(
                 plaintext=plaintext,
                 pass_=passes,
                 seed=seed,
@@ -67,9 +222,9 @@ if FLASK_AVAILABLE:
             
             return jsonify({
                 'success': True,
-                'ciphertext': hashchain.info(0),
-                'key': hashchain.info(1),
-                'plaintext': hashchain.info(3)
+                'ciphertext': result.compressed,
+                'key': result.key,
+                'plaintext': result.plaintext
             })
         
         except Exception as e:
@@ -87,16 +242,286 @@ if FLASK_AVAILABLE:
                 return jsonify({'error': 'Ciphertext e/ou chave não fornecidos'}), 400
             
             # Descriptografa
-            hashchain.decrypt(ciphertext=ciphertext, key=key)
+            result = hashchain.decrypt_text(ciphertext=ciphertext, key=key)
             
             return jsonify({
                 'success': True,
-                'plaintext': hashchain.info(3)
+                'plaintext': result.plaintext
             })
         
         except Exception as e:
             return jsonify({'error': str(e)}), 500
     
+    @app.route('/api/encrypt/batch', methods=['POST'])
+    def api_encrypt_batch():
+        """
+        API para criptografar vários textos em uma requisição.
+        
+        Corpo: {"items": [{"plaintext", "seed"?, "passes"?, "no_salt"?}, ...],
+        "seed"?, "passes"?, "no_salt"?}, com seed/passes/no_salt compartilhados
+        pelos itens que não definem os seus.
+        """
+        try:
+            data = request.get_json(silent=True)
+            items, errors = _batch_items(data, 'plaintext', app.config)
+            if items is None:
+                message, status = errors
+                return jsonify({'error': message}), status
+            
+            try:
+                seed = _parse_seed(data.get('seed', 0))
+                passes = _parse_passes(data.get('passes'))
+                no_salt = _parse_flag(data.get('no_salt', False), 'no_salt')
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+            
+            valid = {}
+            for index, item in enumerate(items):
+                if index in errors:
+                    continue
+                try:
+                    valid[index] = {
+                        'plaintext': item['plaintext'],
+                        'seed': _parse_seed(item.get('seed', 0)),
+                        'passes': _parse_passes(item.get('passes')),
+                        'no_salt': _parse_flag(item.get('no_salt', no_salt), 'no_salt'),
+                    }
+                except ValueError as e:
+                    errors[index] = str(e)
+            
+            results = dict(zip(
+                valid, hashchain.encrypt_batch(list(valid.values()), pass_=passes, seed=seed)
+            ))
+            
+            output = []
+            for index in range(len(items)):
+                result = results.get(index)
+                if index in errors:
+                    output.append({'error': errors[index]})
+                elif isinstance(result, ValueError):
+                    output.append({'error': str(result)})
+                else:
+                    output.append({'ciphertext': result.compressed, 'key': result.key})
+            
+            return jsonify({'success': True, 'results': output})
+        
+        except Exception as e:
+            return jsonify({'error': str(e)}), 500
+    
+    @app.route('/api/decrypt/batch', methods=['POST'])
+    def api_decrypt_batch():
+        """
+        API para descriptografar vários textos em uma requisição.
+        
+        Corpo: {"items": [{"ciphertext", "key"}, ...]}
+        """
+        try:
+            data = request.get_json(silent=True)
+            items, errors = _batch_items(data, 'ciphertext', app.config)
+            if items is None:
+                message, status = errors
+                return jsonify({'error': message}), status
+            
+            valid = {}
+            for index, item in enumerate(items):
+                if index in errors:
+                    continue
+                if not isinstance(item.get('key'), str) or not item['key']:
+                    errors[index] = 'Chave não fornecida'
+                    continue
+                valid[index] = {'ciphertext': item['ciphertext'], 'key': item['key']}
+            
+            results = dict(zip(valid, hashchain.decrypt_batch(list(valid.values()))))
+            
+            output = []
+            for index in range(len(items)):
+                result = results.get(index)
+                if index in errors:
+                    output.append({'error': errors[index]})
+                elif isinstance(result, ValueError):
+                    output.append({'error': str(result)})
+                else:
+                    output.append({'plaintext': result.plaintext})
+            
+            return jsonify({'success': True, 'results': output})
+        
+        except Exception as e:
+            return jsonify({'error': str(e)}), 500
+    
+    @app.route('/api/encrypt/stream', methods=['POST'])
+    def api_encrypt_stream():
+        """
+        API para criptografar o corpo bruto da requisição (text/plain ou application/octet-stream).
+        
+        seed, passes e compress vêm da query string. O corpo é lido em blocos e
+        criptografado com StreamEncryptor (sem salt). A resposta multipart/mixed
+        é enviada à medida que é gerada: a parte "ciphertext" primeiro e a parte
+        "key" no final, pois a chave só é conhecida após o último bloco.
+        """
+        if request.mimetype not in STREAM_MIMETYPES:
+            return jsonify({'error': 'Use Content-Type text/plain ou application/octet-stream'}), 415
+        
+        try:
+            seed = _parse_seed(request.args.get('seed', ''))
+            passes = _parse_passes(request.args.get('passes', ''))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        compress = request.args.get('compress', '1').lower() not in ('0', 'false', 'no')
+        
+        try:
+            decoder = codecs.getincrementaldecoder(request.mimetype_params.get('charset', 'utf-8'))()
+        except LookupError:
+            return jsonify({'error': 'Charset desconhecido'}), 400
+        
+        encryptor = hashchain.stream_encryptor(pass_=passes, seed=seed, compress_text=compress)
+        
+        # O primeiro bloco é lido antes da resposta, para que corpo vazio ou
+        # texto com codificação inválida ainda possam retornar 400
+        first = request.stream.read(STREAM_BLOCK_SIZE)
+        if not first:
+            return jsonify({'error': 'Texto não fornecido'}), 400
+        try:
+            first_ciphertext = encryptor.feed(decoder.decode(first))
+        except UnicodeDecodeError:
+            return jsonify({'error': 'Texto com codificação inválida'}), 400
+        
+        boundary = secrets.token_hex(16)
+        
+        def generate():
+            yield _multipart_part(boundary, 'ciphertext') + first_ciphertext
+            for block in _read_blocks(request.stream):
+                ciphertext = encryptor.feed(decoder.decode(block))
+                if ciphertext:
+                    yield ciphertext
+            ciphertext = encryptor.feed(decoder.decode(b'', final=True))
+            tail, key = encryptor.finalize()
+            yield ciphertext + tail + '\r\n'
+            yield _multipart_part(boundary, 'key') + key + f'\r\n--{boundary}--\r\n'
+        
+        return Response(
+            stream_with_context(generate()),
+            content_type=f'multipart/mixed; boundary={boundary}',
+        )
+    
+    @app.route('/api/decrypt/stream', methods=['POST'])
+    def api_decrypt_stream():
+        """
+        API para descriptografar o corpo bruto da requisição (text/plain ou application/octet-stream).
+        
+        A chave vem no cabeçalho X-HashChain-Key ou, se ele estiver ausente, na
+        primeira linha do corpo (para chaves grandes demais para um cabeçalho).
+        O plaintext é enviado à medida que os segmentos são decodificados.
+        """
+        if request.mimetype not in STREAM_MIMETYPES:
+            return jsonify({'error': 'Use Content-Type text/plain ou application/octet-stream'}), 415
+        
+        try:
+            key = request.headers.get(KEY_HEADER, '')
+            first = b''
+            if not key:
+                key, first = _split_key_line(
+                    request.stream, app.config.get('STREAM_MAX_KEY_LENGTH', STREAM_MAX_KEY_LENGTH)
+                )
+            if not key:
+                return jsonify({'error': 'Chave não fornecida'}), 400
+            
+            decryptor = StreamDecryptor(
+                key,
+                max_length=app.config.get('STREAM_MAX_LENGTH', STREAM_MAX_LENGTH),
+                max_salted_segments=app.config.get(
+                    'STREAM_MAX_SALTED_SEGMENTS', STREAM_MAX_SALTED_SEGMENTS
+                ),
+            )
+            
+            # Lê até o primeiro bloco com ciphertext, para validar o início antes da resposta
+            blocks = _read_blocks(request.stream, first)
+            first_plaintext = ''
+            for block in blocks:
+                if block.strip():
+                    first_plaintext = decryptor.feed(block)
+                    break
+            else:
+                return jsonify({'error': 'Ciphertext não fornecido'}), 400
+        except (ValueError, UnicodeDecodeError) as e:
+            return jsonify({'error': str(e)}), 400
+        
+        def generate():
+            if first_plaintext:
+                yield first_plaintext
+            for block in blocks:
+                plaintext = decryptor.feed(block)
+                if plaintext:
+                    yield plaintext
+            plaintext = decryptor.finalize()
+            if plaintext:
+                yield plaintext
+        
+        return Response(stream_with_context(generate()), mimetype='text/plain')
+    
+    @app.route('/api/jobs', methods=['POST'])
+    def api_create_job():
+        """
+        API para criptografar/descriptografar textos grandes em segundo plano.
+        
+        Corpo: {"type": "encrypt", "plaintext", "seed"?, "passes"?, "no_salt"?}
+        ou {"type": "decrypt", "ciphertext", "key"}. Retorna 202 com o job_id.
+        """
+        try:
+            data = request.get_json(silent=True)
+            if not isinstance(data, dict):
+                return jsonify({'error': 'Corpo JSON inválido'}), 400
+            
+            kind = data.get('type', JobManager.KIND_ENCRYPT)
+            
+            if kind == JobManager.KIND_ENCRYPT:
+                plaintext = data.get('plaintext', '')
+                if not plaintext or not isinstance(plaintext, str):
+                    return jsonify({'error': 'Texto não fornecido'}), 400
+                try:
+                    params = {
+                        'plaintext': plaintext,
+                        'seed': _parse_seed(data.get('seed', 0)),
+                        'pass_': _parse_passes(data.get('passes')),
+                        'no_salt': _parse_flag(data.get('no_salt', False), 'no_salt'),
+                    }
+                except ValueError as e:
+                    return jsonify({'error': str(e)}), 400
+            elif kind == JobManager.KIND_DECRYPT:
+                ciphertext = data.get('ciphertext', '')
+                key = data.get('key', '')
+                if not ciphertext or not key or not isinstance(ciphertext, str) or not isinstance(key, str):
+                    return jsonify({'error': 'Ciphertext e/ou chave não fornecidos'}), 400
+                params = {'ciphertext': ciphertext, 'key': key}
+            else:
+                return jsonify({'error': f'Tipo de job inválido: {kind}'}), 400
+            
+            try:
+                job_id = _get_job_manager(app.config).submit(kind, params)
+            except JobQueueFullError as e:
+                return jsonify({'error': str(e)}), 503
+            
+            return jsonify({
+                'success': True,
+                'job_id': job_id,
+                'status': JobManager.STATUS_QUEUED
+            }), 202
+        
+        except Exception as e:
+            return jsonify({'error': str(e)}), 500
+    
+    @app.route('/api/jobs/<job_id>', methods=['GET'])
+    def api_job_status(job_id):
+        """API para consultar o estado e o resultado de um job."""
+        try:
+            info = _get_job_manager(app.config).status(job_id)
+            if info is None:
+                return jsonify({'error': 'Job não encontrado ou expirado'}), 404
+            
+            return jsonify(info)
+        
+        except Exception as e:
+            return jsonify({'error': str(e)}), 500
+    
     @app.route('/api/compress', methods=['POST'])
     def api_compress():
         """API para comprimir texto binário."""
@@ -130,10 +555,10 @@ if FLASK_AVAILABLE:
             if not compressed_text:
                 return jsonify({'error': 'Texto comprimido não fornecido'}), 400
             
-            result = hashchain.decompression(compressed_text)
-            
-            if result.startswith("Erro"):
-                return jsonify({'error': result}), 400
+            try:
+                result = hashchain.decompression(compressed_text)
+            except DecompressionError as e:
+                return jsonify({'error': str(e)}), 400
             
             return jsonify({
                 'success': True,
@@ -175,5 +600,6 @@ def run_web(host='127.0.0.1', port=5000, debug=False):
     print(f"\n🌐 Servidor web HashChain iniciado em http://{host}:{port}")
     print(f"📝 Acesse http://{host}:{port} no seu navegador")
     print(f"🛑 Pressione Ctrl+C para parar o servidor\n")
-    app.run(host=host, port=port, debug=debug)
+    # Criptografias simultâneas são seguras: cada chamada usa o próprio random.Random
+    app.run(host=host, port=port, debug=debug, threaded=True)
 
@@ -0,0 +1,229 @@
+"""Jobs assíncronos da interface web, executados em um pool de processos limitado."""
+import atexit
+import multiprocessing
+import secrets
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+from hashchain import HashChain
+
+
+class JobQueueFullError(ValueError):
+    """Erro lançado quando a fila de jobs atinge o limite de jobs pendentes."""
+
+
+def _run_job(kind: str, params: Dict) -> Dict:
+    """
+    Executa um job no processo do pool.
+    
+    Args:
+        kind: "encrypt" ou "decrypt"
+        params: Argumentos de HashChain.encrypt_text / decrypt_text
+    
+    Returns:
+        Dicionário serializável em JSON com o resultado
+    """
+    hashchain = HashChain()
+    
+    if kind == JobManager.KIND_ENCRYPT:
+        result = hashchain.encrypt_text(**params)
+        return {
+            'ciphertext': result.compressed,
+            'key': result.key,
+            'invalid_characters': list(result.invalid_characters),
+        }
+    
+    result = hashchain.decrypt_text(**params)
+    return {'plaintext': result.plaintext}
+
+
+class Job:
+    """Estado de um job: tipo, Future do pool e horários."""
+    
+    __slots__ = ('job_id', 'kind', 'future', 'created_at', 'finished_at')
+    
+    def __init__(self, job_id: str, kind: str, future: Future):
+        """
+        Inicializa o job.
+        
+        Args:
+            job_id: Identificador do job
+            kind: "encrypt" ou "decrypt"
+            future: Future do pool de processos
+        """
+        self.job_id = job_id
+        self.kind = kind
+        self.future = future
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+
+
+class JobManager:
+    """
+    Fila de jobs de criptografia/descriptografia em um pool de processos limitado.
+    
+    O trabalho pesado sai das threads do servidor, que continuam livres para
+    atender requisições pequenas. Jobs concluídos expiram após ttl segundos.
+    
+    O pool é criado a partir de uma thread de requisição, então os processos
+    não usam fork (que copiaria o estado das outras threads e seus locks):
+    usam forkserver quando disponível, senão spawn. O pool é encerrado na
+    saída do interpretador.
+    """
+    
+    KIND_ENCRYPT = 'encrypt'
+    KIND_DECRYPT = 'decrypt'
+    
+    STATUS_QUEUED = 'queued'
+    STATUS_RUNNING = 'running'
+    STATUS_DONE = 'done'
+    STATUS_ERROR = 'error'
+    
+    def __init__(self, max_workers: int = 2, max_pending: int = 100, ttl: float = 600.0):
+        """
+        Inicializa o gerenciador (o pool só é criado no primeiro job).
+        
+        Args:
+            max_workers: Número de processos do pool
+            max_pending: Máximo de jobs não concluídos (na fila ou em execução)
+            ttl: Tempo, em segundos, que um job concluído fica disponível
+        
+        Raises:
+            ValueError: Se algum limite for inválido
+        """
+        if max_workers < 1 or max_pending < 1 or ttl <= 0:
+            raise ValueError("max_workers, max_pending e ttl devem ser positivos")
+        
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.ttl = ttl
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        atexit.register(self.shutdown)
+    
+    @staticmethod
+    def _mp_context() -> multiprocessing.context.BaseContext:
+        """Contexto de multiprocessing do pool: forkserver, ou spawn onde não existe."""
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            return multiprocessing.get_context("forkserver")
+        return multiprocessing.get_context("spawn")
+    
+    def submit(self, kind: str, params: Dict) -> str:
+        """
+        Enfileira um job.
+        
+        Args:
+            kind: "encrypt" ou "decrypt"
+            params: Argumentos de HashChain.encrypt_text / decrypt_text
+        
+        Returns:
+            Identificador do job
+        
+        Raises:
+            ValueError: Se o tipo for inválido
+            JobQueueFullError: Se a fila de jobs estiver cheia
+        """
+        if kind not in (self.KIND_ENCRYPT, self.KIND_DECRYPT):
+            raise ValueError(f"Tipo de job inválido: {kind}")
+        
+        with self._lock:
+            self._purge_expired()
+            
+            pending = sum(1 for job in self._jobs.values() if job.finished_at is None)
+            if pending >= self.max_pending:
+                raise JobQueueFullError(f"Fila de jobs cheia ({self.max_pending} pendentes)")
+            
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers, mp_context=self._mp_context()
+                )
+            
+            job_id = secrets.token_hex(16)
+            job = Job(job_id, kind, self._pool.submit(_run_job, kind, params))
+            self._jobs[job_id] = job
+        
+        job.future.add_done_callback(lambda _: self._mark_finished(job))
+        return job_id
+    
+    def _mark_finished(self, job: Job) -> None:
+        """Registra o horário de conclusão (início da contagem de expiração)."""
+        with self._lock:
+            job.finished_at = time.time()
+    
+    def _purge_expired(self) -> None:
+        """Remove os jobs concluídos há mais de ttl segundos (chamado com o lock)."""
+        limit = time.time() - self.ttl
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished_at is not None and job.finished_at < limit
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+    
+    def status(self, job_id: str) -> Optional[Dict]:
+        """
+        Consulta um job.
+        
+        Args:
+            job_id: Identificador retornado por submit()
+        
+        Returns:
+            Dicionário com job_id, type, status, created_at e, conforme o estado,
+            queue_position, finished_at, expires_at, result ou error;
+            None se o job não existir ou tiver expirado
+        """
+        with self._lock:
+            self._purge_expired()
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            
+            info = {
+                'job_id': job.job_id,
+                'type': job.kind,
+                'created_at': job.created_at,
+            }
+            
+            if job.finished_at is None:
+                if job.future.running():
+                    info['status'] = self.STATUS_RUNNING
+                else:
+                    info['status'] = self.STATUS_QUEUED
+                    info['queue_position'] = self._queue_position(job)
+                return info
+        
+        info['finished_at'] = job.finished_at
+        info['expires_at'] = job.finished_at + self.ttl
+        
+        if job.future.cancelled():
+            info['status'] = self.STATUS_ERROR
+            info['error'] = 'Job cancelado'
+            return info
+        
+        error = job.future.exception()
+        if error is None:
+            info['status'] = self.STATUS_DONE
+            info['result'] = job.future.result()
+        else:
+            info['status'] = self.STATUS_ERROR
+            info['error'] = str(error)
+        
+        return info
+    
+    def _queue_position(self, job: Job) -> int:
+        """Quantidade de jobs na fila à frente do job (chamado com o lock)."""
+        waiting: List[Job] = [
+            other for other in self._jobs.values()
+            if other.finished_at is None and not other.future.running()
+        ]
+        return sum(1 for other in waiting if other.created_at < job.created_at)
+    
+    def shutdown(self) -> None:
+        """Encerra o pool de processos, cancelando os jobs ainda na fila."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
@@ -1,5 +1,5 @@
 """Módulo de geração de tabelas de substituição."""
 from .table_generator import TableGenerator
+from .table_cache import TableCache, shared_table_cache
 
-__all__ = ['TableGenerator']
-
+__all__ = ['TableGenerator', 'TableCache', 'shared_table_cache']
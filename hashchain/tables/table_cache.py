@@ -0,0 +1,136 @@
+"""Cache LRU de tabelas de substituição compartilhado pelo processo."""
+import sys
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from .table_generator import TableGenerator
+
+
+class TableCache:
+    """
+    Cache LRU thread-safe de tabelas (normal e invertida) por (seed, tamanho, alfabeto).
+    
+    As tabelas são entregues como MappingProxyType (somente leitura), já que o
+    mesmo objeto é compartilhado por todos os chamadores; quem precisar de um
+    dict (ex: laços de substituição) usa .copy().
+    """
+    
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+    
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Inicializa o cache de tabelas.
+        
+        Args:
+            max_bytes: Orçamento de memória aproximado do cache, em bytes
+        """
+        if max_bytes < 0:
+            raise ValueError("max_bytes deve ser maior ou igual a zero")
+        
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple, Tuple[Mapping[str, str], Mapping[str, str], int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    @staticmethod
+    def _estimate_size(table: Dict[str, str], inverted: Dict[str, str]) -> int:
+        """
+        Estima a memória ocupada por um par de tabelas.
+        
+        As cifras são os mesmos objetos nas duas tabelas, então são contadas uma vez.
+        """
+        return (
+            sys.getsizeof(table)
+            + sys.getsizeof(inverted)
+            + sum(sys.getsizeof(v) for v in table.values())
+        )
+    
+    def get(
+        self,
+        seed: int,
+        size: int,
+        characters: Optional[List[str]] = None,
+    ) -> Tuple[Mapping[str, str], Mapping[str, str]]:
+        """
+        Obtém as tabelas de um passe, gerando-as apenas se não estiverem em cache.
+        
+        Args:
+            seed: Seed do passe (ex: seed * 1000000 + passe)
+            size: Tamanho das cifras (passe)
+            characters: Alfabeto da tabela (opcional, padrão do TableGenerator)
+        
+        Returns:
+            Tupla contendo (tabela_normal, tabela_invertida), somente leitura
+        """
+        alphabet = tuple(characters) if characters else None
+        cache_key = (seed, size, alphabet)
+        
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None:
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                return entry[0], entry[1]
+            self.misses += 1
+        
+        # Gera fora do lock para não serializar threads em tabelas diferentes
+        table_gen = TableGenerator(seed, characters)
+        tables, inverted_tables = table_gen.generate_tables([size])
+        table, inverted = tables[size], inverted_tables[size]
+        entry_size = self._estimate_size(table, inverted)
+        table, inverted = MappingProxyType(table), MappingProxyType(inverted)
+        
+        with self._lock:
+            existing = self._entries.get(cache_key)
+            if existing is not None:
+                self._entries.move_to_end(cache_key)
+                return existing[0], existing[1]
+            
+            if entry_size <= self.max_bytes:
+                self._entries[cache_key] = (table, inverted, entry_size)
+                self._current_bytes += entry_size
+                while self._current_bytes > self.max_bytes:
+                    _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                    self._current_bytes -= evicted_size
+                    self.evictions += 1
+        
+        return table, inverted
+    
+    def clear(self) -> None:
+        """Remove todas as tabelas do cache e zera os contadores."""
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Retorna estatísticas de uso do cache.
+        
+        Returns:
+            Dicionário com hits, misses, evictions, entries, bytes e max_bytes
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._current_bytes,
+                "max_bytes": self.max_bytes,
+            }
+    
+    def __len__(self) -> int:
+        """Retorna a quantidade de tabelas em cache."""
+        return len(self._entries)
+
+
+# Instância compartilhada entre Encryption e Decryption
+shared_table_cache = TableCache()
@@ -1,5 +1,11 @@
 """Gerador de tabelas de substituição determinísticas."""
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 
 class TableGenerator:
@@ -19,19 +25,24 @@ class TableGenerator:
         "Í", "Ì", "Î", "Ï", "Ó", "Ò", "Ô", "Õ", "Ö", "Ú", "Ù", "Û", "Ü", "Ç"
     ]
     
-    def __init__(self, seed: int, characters: List[str] = None):
+    def __init__(self, seed: int, characters: List[str] = None, use_numpy: Optional[bool] = None):
         """
         Inicializa o gerador de tabelas.
         
         Args:
             seed: Seed para geração determinística
             characters: Lista de caracteres a serem codificados (opcional)
+            use_numpy: Se True, usa o backend NumPy; se None, usa quando disponível
         """
         if not seed:
             raise ValueError("Deve fornecer o parâmetro seed")
         
+        if use_numpy and not NUMPY_AVAILABLE:
+            raise ValueError("Backend NumPy solicitado, mas o NumPy não está instalado")
+        
         self.seed = seed
         self.characters = characters or self.DEFAULT_CHARACTERS
+        self.use_numpy = NUMPY_AVAILABLE if use_numpy is None else use_numpy
         self._tables: Dict[int, Dict[str, str]] = {}
         self._inverted_tables: Dict[int, Dict[str, str]] = {}
     
@@ -55,6 +66,64 @@ class TableGenerator:
         
         return ''.join(middle)
     
+    def generate_cipher(self, char: str, size: int) -> str:
+        """
+        Gera apenas a cifra de um caractere, sem montar a tabela inteira.
+        
+        Equivalente a generate_tables([size])[0][size][char].
+        
+        Args:
+            char: Caractere a ser codificado
+            size: Tamanho da cifra
+            
+        Returns:
+            String binária representando a cifra
+            
+        Raises:
+            KeyError: Se o caractere não pertencer ao alfabeto
+        """
+        if char not in self.characters:
+            raise KeyError(char)
+        
+        # Em caracteres repetidos a tabela guarda a cifra da última ocorrência
+        index = len(self.characters) - 1 - self.characters[::-1].index(char)
+        if size <= 0:
+            return ""
+        
+        num = (self.seed + index * 2654435761) & ((1 << size) - 1)
+        return format(num, f"0{size}b")[::-1]
+    
+    def _generate_ciphers_numpy(self, size: int) -> List[str]:
+        """
+        Gera as cifras de todos os caracteres de uma vez usando NumPy.
+        
+        Equivalente a chamar _generate_cipher(size, i) para cada índice: os bits
+        saem dos bytes little-endian de seed + index * 2654435761.
+        
+        Args:
+            size: Tamanho da cifra
+            
+        Returns:
+            Lista de strings binárias, na ordem de self.characters
+        """
+        n_chars = len(self.characters)
+        n_bytes = (size + 7) // 8
+        mask = (1 << (n_bytes * 8)) - 1
+        
+        # O & com a máscara preserva o complemento de dois de seeds negativas
+        raw = b"".join(
+            ((self.seed + i * 2654435761) & mask).to_bytes(n_bytes, "little")
+            for i in range(n_chars)
+        )
+        bits = np.unpackbits(
+            np.frombuffer(raw, dtype=np.uint8).reshape(n_chars, n_bytes),
+            axis=1,
+            bitorder="little",
+        )[:, :size]
+        text = (bits + ord("0")).tobytes().decode("ascii")
+        
+        return [text[i * size:(i + 1) * size] for i in range(n_chars)]
+    
     def generate_tables(self, specific_sizes: List[int]) -> Tuple[Dict[int, Dict[str, str]], Dict[int, Dict[str, str]]]:
         """
         Gera tabelas de cifra para tamanhos específicos.
@@ -71,9 +140,12 @@ class TableGenerator:
         tables_ = {}
         
         for size in specific_sizes:
-            table = {}
-            for i, char in enumerate(self.characters):
-                table[char] = self._generate_cipher(size, i)
+            if self.use_numpy:
+                table = dict(zip(self.characters, self._generate_ciphers_numpy(size)))
+            else:
+                table = {}
+                for i, char in enumerate(self.characters):
+                    table[char] = self._generate_cipher(size, i)
             tables_[size] = table
         
         self._tables = tables_
@@ -8,6 +8,7 @@ import sys
 from pathlib import Path
 
 from hashchain import HashChain
+from hashchain.core import DecompressionError
 from hashchain.utils import Handler, InputCollector, ColorFormatter
 from hashchain.config import ConfigManager
 
@@ -690,9 +691,12 @@ def handle_decompress():
     
     texto = input(f"\n{r}{color.c('c', True)}Digite o texto a ser descomprimido: {r}").upper()
     print(f"\n{color.c('b')}Texto descomprimido:{r}")
-    resultado = hashchain.decompression(texto)
-    if resultado is not None and not resultado.startswith("Erro"):
-        print(f'{r}{color.format(faint=True)}{resultado}{r}')
+    try:
+        resultado = hashchain.decompression(texto)
+    except DecompressionError as e:
+        print(f"{r}{color.c('r')}{e}{r}")
+        return
+    print(f'{r}{color.format(faint=True)}{resultado}{r}')
 
 
 def handle_web_interface():
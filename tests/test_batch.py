@@ -0,0 +1,70 @@
+"""Testes dos lotes de HashChain (encrypt_batch e decrypt_batch)."""
+import unittest
+
+from hashchain import DecryptResult, EncryptResult, HashChain
+
+
+class TestBatch(unittest.TestCase):
+    """Resultado ou ValueError por item, na ordem dos itens."""
+    
+    def setUp(self):
+        self.hashchain = HashChain()
+    
+    def test_round_trip_in_order(self):
+        items = [
+            {"plaintext": "primeiro", "seed": 11},
+            {"plaintext": "segundo"},
+            {"plaintext": "terceiro", "seed": 11, "passes": [30, 40]},
+            {"plaintext": "quarto", "no_salt": True},
+        ]
+        encrypted = self.hashchain.encrypt_batch(items, pass_=[50, 25], seed=22)
+        self.assertTrue(all(isinstance(result, EncryptResult) for result in encrypted))
+        self.assertEqual([result.seed for result in encrypted], [11, 22, 11, 22])
+        self.assertEqual(encrypted[2].passes, (30, 40))
+        
+        decrypted = self.hashchain.decrypt_batch(
+            [{"ciphertext": result.ciphertext, "key": result.key} for result in encrypted]
+        )
+        self.assertTrue(all(isinstance(result, DecryptResult) for result in decrypted))
+        self.assertEqual(
+            [result.plaintext for result in decrypted],
+            [item["plaintext"] for item in items],
+        )
+    
+    def test_invalid_items_do_not_fail_the_batch(self):
+        items = [
+            {"plaintext": "válido", "seed": 5},
+            "não é um dicionário",
+            {"plaintext": 123},
+            {"plaintext": b"bytes"},
+            {"plaintext": "abc", "seed": "x"},
+            {"plaintext": "abc", "seed": 1.5},
+            {"plaintext": "abc", "passes": [2.5]},
+            {"plaintext": "abc", "passes": "30 40"},
+            {"plaintext": "abc", "no_salt": "false"},
+            {"plaintext": ""},
+            {"plaintext": "também válido", "seed": 5},
+        ]
+        results = self.hashchain.encrypt_batch(items)
+        
+        self.assertIsInstance(results[0], EncryptResult)
+        self.assertIsInstance(results[-1], EncryptResult)
+        for index, result in enumerate(results[1:-1], start=1):
+            with self.subTest(item=items[index]):
+                self.assertIsInstance(result, ValueError)
+    
+    def test_invalid_decrypt_items(self):
+        encrypted = self.hashchain.encrypt_text("ok", seed=3)
+        results = self.hashchain.decrypt_batch([
+            {"ciphertext": 1, "key": encrypted.key},
+            {"ciphertext": encrypted.ciphertext, "key": 5},
+            None,
+            {"ciphertext": encrypted.ciphertext, "key": "H2x"},
+            {"ciphertext": encrypted.ciphertext, "key": encrypted.key},
+        ])
+        self.assertTrue(all(isinstance(result, ValueError) for result in results[:4]))
+        self.assertEqual(results[4].plaintext, "ok")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+"""Testes do formato empacotado em bytes (BitPacking e encrypt_bytes)."""
+import unittest
+
+from hashchain import HashChain
+from hashchain.core import Decryption, Encryption
+from hashchain.core.bitpacking import BitPacking
+
+
+class TestBitPacking(unittest.TestCase):
+    """Empacotamento de texto binário, 8 bits por byte."""
+    
+    def test_pack_unpack(self):
+        for bits in ("", "1", "0", "10110", "0" * 8, "1" * 9, "1011001110001111" * 5 + "101"):
+            with self.subTest(bits=bits):
+                data = BitPacking.pack(bits)
+                self.assertEqual(len(data), (len(bits) + 7) // 8)
+                self.assertEqual(BitPacking.unpack(data, len(bits)), bits)
+    
+    def test_pack_rejects_non_binary(self):
+        with self.assertRaises(ValueError):
+            BitPacking.pack("0102")
+
+
+class TestEncryptBytes(unittest.TestCase):
+    """encrypt_bytes/decrypt_bytes fazem o caminho de ida e volta do texto."""
+    
+    def test_round_trip(self):
+        for plaintext in ("a", "Mensagem secreta!", "Olá, mundo! " * 40):
+            for no_salt in (True, False):
+                with self.subTest(plaintext=plaintext[:10], no_salt=no_salt):
+                    ciphertext, key, _ = Encryption().encrypt_bytes(
+                        plaintext, pass_=[50, 25, 60], seed=4242, no_salt=no_salt
+                    )
+                    self.assertIsInstance(ciphertext, bytes)
+                    self.assertEqual(Decryption().decrypt_bytes(ciphertext, key)[0], plaintext)
+    
+    def test_same_bits_as_text_format(self):
+        text_ciphertext, text_key, _ = Encryption().encrypt(
+            "Mensagem secreta!", pass_=[50, 25, 60], seed=4242, no_salt=True, compress_text=False
+        )
+        ciphertext, key, _ = Encryption().encrypt_bytes(
+            "Mensagem secreta!", pass_=[50, 25, 60], seed=4242, no_salt=True
+        )
+        self.assertEqual(key, text_key)
+        self.assertEqual(BitPacking.unpack(ciphertext, len(text_ciphertext)), text_ciphertext)
+    
+    def test_invalid_characters_match_text_format(self):
+        plaintext = "ñabc€d olá\n" * 40
+        text_ciphertext, text_key, _ = Encryption().encrypt(plaintext, pass_=[50, 25, 60], seed=4242)
+        ciphertext, key, _ = Encryption().encrypt_bytes(plaintext, pass_=[50, 25, 60], seed=4242)
+        self.assertEqual(
+            Decryption().decrypt_bytes(ciphertext, key)[0],
+            Decryption().decrypt(text_ciphertext, text_key)[0],
+        )
+    
+    def test_hashchain_round_trip(self):
+        hashchain = HashChain()
+        ciphertext, key = hashchain.encrypt_bytes("Olá, bytes!", pass_=[40, 70], seed=99)
+        self.assertEqual(hashchain.decrypt_bytes(ciphertext, key), "Olá, bytes!")
+    
+    def test_decrypt_bytes_rejects_text(self):
+        with self.assertRaises(ValueError):
+            Decryption().decrypt_bytes("0101", "H200")
+
+
+if __name__ == "__main__":
+    unittest.main()
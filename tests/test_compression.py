@@ -0,0 +1,29 @@
+"""Testes dos codecs de texto de Compression."""
+import unittest
+
+from hashchain.core.compression import Compression, DecompressionError, LZMA_AVAILABLE, TextCodec
+
+BITS = "0110100111" * 300
+
+
+class TestTextCodecs(unittest.TestCase):
+    """Codecs registrados em Compression."""
+    
+    def test_codec_round_trip(self):
+        for name, codec in Compression.CODECS.items():
+            with self.subTest(codec=name):
+                self.assertEqual(codec.decode(codec.encode(BITS), len(BITS)), BITS)
+    
+    def test_invalid_payload_raises_decompression_error(self):
+        names = ["zlib", "lzma"] if LZMA_AVAILABLE else ["zlib"]
+        for name in names:
+            with self.subTest(codec=name), self.assertRaises(DecompressionError):
+                Compression.CODECS[name].unpack("abcde")
+    
+    def test_text_codec_is_abstract(self):
+        with self.assertRaises(TypeError):
+            TextCodec()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+"""Testes da leitura de chaves legadas (sem cabeçalho)."""
+import unittest
+
+from hashchain.core import Decryption, Encryption, KeyGenerator
+
+counted = KeyGenerator._counted
+
+
+def legacy_key(plaintext, no_salt):
+    """Criptografa e reescreve a chave no formato legado, com ou sem salt."""
+    ciphertext, key, _ = Encryption().encrypt(
+        plaintext, pass_=[30, 45], seed=321, no_salt=no_salt, compress_text=False
+    )
+    fields = Decryption()._read_key(key)
+    body = "".join([
+        counted(len(fields["passes"])),
+        "".join(str(p).zfill(3) for p in fields["passes"]),
+        counted(fields["cl"]),
+        counted(fields["seed"]),
+        str(fields["padding"]),
+    ])
+    if no_salt:
+        return ciphertext, "0010" + body
+    prefix = counted(len(fields["posicoes"])) + "".join(counted(pos) for pos in fields["posicoes"])
+    return ciphertext, prefix + "0011" + body
+
+
+class TestLegacyKey(unittest.TestCase):
+    """Detecção estrutural do formato legado com ou sem salt."""
+    
+    def test_legacy_round_trip(self):
+        for plaintext in ("abc", "Mensagem secreta, um pouco maior!"):
+            for no_salt in (True, False):
+                with self.subTest(plaintext=plaintext, no_salt=no_salt):
+                    ciphertext, key = legacy_key(plaintext, no_salt)
+                    
+                    self.assertIs(Decryption._has_legacy_salt_layout(key), not no_salt)
+                    self.assertEqual(Decryption().decrypt(ciphertext, key)[0], plaintext)
+    
+    def test_malformed_legacy_key_raises_value_error(self):
+        for key in ("", "00", "0010", "001x002030", "0010001102"):
+            with self.subTest(key=key):
+                self.assertFalse(Decryption._has_legacy_salt_layout(key))
+                with self.assertRaises(ValueError):
+                    Decryption().decrypt("0" * 60, key)
+    
+    def test_legacy_key_with_inconsistent_length_is_rejected(self):
+        key = "0010" + counted(2) + "030030" + counted(61) + counted(7)
+        with self.assertRaisesRegex(ValueError, "inconsistência"):
+            Decryption().decrypt("0" * 61, key)
+
+
+if __name__ == "__main__":
+    unittest.main()
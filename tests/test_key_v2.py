@@ -0,0 +1,119 @@
+"""Testes do formato de chave v2 (ciclo de passes)."""
+import unittest
+
+from hashchain.core import Decryption, Encryption, KeyGenerator
+
+counted = KeyGenerator._counted
+
+
+def cycle_key(plaintext_length, pass_cycle, invalid_positions, cl, seed=12345, padding=""):
+    """Monta uma chave v2 sem salt a partir dos campos."""
+    return "".join([
+        "H20",
+        counted(plaintext_length),
+        counted(len(pass_cycle)),
+        "".join(str(p).zfill(3) for p in pass_cycle),
+        counted(len(invalid_positions)),
+        "".join(counted(pos) for pos in invalid_positions),
+        counted(cl),
+        counted(seed),
+        padding,
+    ])
+
+
+def salted_key(salt_l, plaintext_length=3, cl=90):
+    """Monta uma chave v2 com salt derivado da seed (salt_flag 2)."""
+    base = cycle_key(plaintext_length, [30], [], cl)
+    return "H22" + counted(salt_l) + "020999" + base[3:]
+
+
+class TestKeyV2RoundTrip(unittest.TestCase):
+    """Criptografia e descriptografia com chaves v2."""
+    
+    def test_round_trip(self):
+        for plaintext in ("Mensagem secreta!", "olá ñ mundo €\n fim", "a" * 500):
+            for pass_ in ([20], [50, 25, 60, 38], None):
+                for no_salt in (True, False):
+                    with self.subTest(plaintext=plaintext[:10], pass_=pass_, no_salt=no_salt):
+                        ciphertext, key, info = Encryption().encrypt(
+                            plaintext, pass_=list(pass_) if pass_ else None, seed=987654321,
+                            no_salt=no_salt,
+                        )
+                        
+                        self.assertTrue(key.startswith("H2"))
+                        expected = "".join(c for c in plaintext if c not in info["invalid_characters"])
+                        self.assertEqual(Decryption().decrypt(ciphertext, key)[0], expected)
+    
+    def test_round_trip_uncompressed_and_invalid_positions(self):
+        ciphertext, key, info = Encryption().encrypt(
+            "ñabc€d", pass_=[30, 40], seed=42, no_salt=True, compress_text=False
+        )
+        
+        self.assertEqual(info["invalid_characters"], ["ñ", "€"])
+        self.assertEqual(Decryption().decrypt(ciphertext, key)[0], "abcd")
+    
+    def test_hand_built_key_matches_encryptor(self):
+        _, key, _ = Encryption().encrypt(
+            "abc", pass_=[30], seed=12345, no_salt=True, compress_text=False
+        )
+        
+        self.assertEqual(key, cycle_key(3, [30], [], 90, padding="10"))
+
+
+class TestMalformedKeyV2(unittest.TestCase):
+    """Chaves v2 inconsistentes são rejeitadas antes de expandir os passes."""
+    
+    def test_plaintext_length_larger_than_ciphertext_is_rejected(self):
+        with self.assertRaisesRegex(ValueError, "comprimento do texto"):
+            Decryption().decrypt("0" * 60, cycle_key(10 ** 10, [20], [], 60))
+    
+    def test_declared_length_larger_than_ciphertext_is_rejected(self):
+        with self.assertRaisesRegex(ValueError, "comprimento declarado"):
+            Decryption().decrypt("0" * 60, cycle_key(10 ** 10, [20], [], 20 * 10 ** 10))
+    
+    def test_more_invalid_positions_than_characters_is_rejected(self):
+        with self.assertRaisesRegex(ValueError, "posições inválidas"):
+            Decryption().decrypt("0" * 20, cycle_key(1, [20], [0, 0], 20))
+    
+    def test_invalid_position_outside_text_is_rejected(self):
+        with self.assertRaisesRegex(ValueError, "fora do texto"):
+            Decryption().decrypt("0" * 40, cycle_key(3, [20], [3], 40))
+    
+    def test_truncated_key_is_rejected(self):
+        key = cycle_key(3, [30], [1], 60)
+        for cut in (3, 6, 10, 14):
+            with self.subTest(cut=cut), self.assertRaises(ValueError):
+                Decryption().decrypt("0" * 60, key[:cut])
+    
+    def test_unknown_salt_flag_is_rejected(self):
+        key = "H29" + cycle_key(3, [30], [], 90)[3:]
+        with self.assertRaisesRegex(ValueError, "flag de salt"):
+            Decryption().decrypt("0" * 100, key)
+    
+    def test_salt_count_outside_encryptor_range_is_rejected(self):
+        for salt_l in (0, 19, 24, 10 ** 9):
+            with self.subTest(salt_l=salt_l), self.assertRaisesRegex(ValueError, "quantidade de salt"):
+                Decryption().decrypt("0" * 100, salted_key(salt_l))
+    
+    def test_explicit_salt_count_outside_encryptor_range_is_rejected(self):
+        items = "".join(counted(0) + "030" for _ in range(19))
+        key = "H21" + counted(19) + items + cycle_key(3, [30], [], 90)[3:]
+        with self.assertRaisesRegex(ValueError, "quantidade de salt"):
+            Decryption().decrypt("0" * 100, key)
+    
+    def test_non_numeric_field_is_reported_by_name(self):
+        key = cycle_key(3, [30], [], 90)
+        cases = {
+            "comprimento do texto": key[:3] + "0x1" + key[6:],
+            "ciclo": key.replace("030", "0a0", 1),
+            "padding": key + "x",
+        }
+        for field, bad_key in cases.items():
+            with self.subTest(field=field), self.assertRaisesRegex(
+                ValueError, f"^Chave inválida: campo {field} não numérico"
+            ):
+                Decryption().decrypt("0" * 100, bad_key)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+"""Testes da criptografia e descriptografia em vários processos."""
+import random
+import unittest
+
+from hashchain.core import Decryption, Encryption
+
+PLAINTEXT = "Mensagem de teste para os processos do pool. " * 400
+
+
+class TestParallel(unittest.TestCase):
+    """Com workers > 1 o resultado é idêntico ao de um único processo."""
+    
+    def test_parallel_decrypt_matches_serial(self):
+        for pass_ in ([30, 45, 60], None):
+            with self.subTest(pass_=pass_):
+                ciphertext, key, _ = Encryption().encrypt(PLAINTEXT, pass_=pass_, seed=99, no_salt=False)
+                
+                self.assertEqual(Decryption().decrypt(ciphertext, key, workers=3)[0], PLAINTEXT)
+    
+    def test_parallel_encrypt_matches_serial(self):
+        plaintext = PLAINTEXT * 4
+        for cycle_len in (3, None):
+            with self.subTest(cycle_len=cycle_len):
+                # Sem cycle_len, um passe por caractere, como os passes gerados automaticamente
+                rng = random.Random(5)
+                pass_ = [rng.randint(20, 999) for _ in range(cycle_len or len(plaintext))]
+                serial = Encryption().encrypt(plaintext, pass_=pass_, seed=99, no_salt=True)
+                parallel = Encryption().encrypt(plaintext, pass_=pass_, seed=99, no_salt=True, workers=3)
+                
+                self.assertEqual(parallel[:2], serial[:2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+"""Testes da API sem estado do HashChain (EncryptResult e DecryptResult)."""
+import dataclasses
+import unittest
+
+from hashchain import DecryptResult, EncryptResult, HashChain
+
+
+class TestResults(unittest.TestCase):
+    """encrypt_text/decrypt_text devolvem resultados imutáveis e não guardam estado."""
+    
+    def setUp(self):
+        self.hashchain = HashChain()
+        self.encrypted = self.hashchain.encrypt_text("Olá, mundo!", pass_=[50, 25, 60], seed=4242)
+    
+    def test_results_are_frozen(self):
+        decrypted = self.hashchain.decrypt_text(self.encrypted.ciphertext, self.encrypted.key)
+        for result, field in ((self.encrypted, "ciphertext"), (decrypted, "plaintext")):
+            with self.subTest(result=type(result).__name__):
+                with self.assertRaises(dataclasses.FrozenInstanceError):
+                    setattr(result, field, "outro")
+                with self.assertRaises((AttributeError, TypeError)):
+                    result.extra = 1
+    
+    def test_sequences_are_tuples(self):
+        self.assertIsInstance(self.encrypted, EncryptResult)
+        self.assertEqual(self.encrypted.passes, (50, 25, 60))
+        self.assertIsInstance(self.encrypted.invalid_characters, tuple)
+    
+    def test_round_trip_without_instance_state(self):
+        info = list(self.hashchain._info)
+        decrypted = self.hashchain.decrypt_text(self.encrypted.ciphertext, self.encrypted.key)
+        
+        self.assertIsInstance(decrypted, DecryptResult)
+        self.assertEqual(decrypted.plaintext, "Olá, mundo!")
+        self.assertEqual(decrypted.seed, 4242)
+        self.assertEqual(self.hashchain._info, info)
+    
+    def test_legacy_api_reads_result(self):
+        expected = self.hashchain.encrypt_text("Olá, mundo!", pass_=[50, 25, 60], seed=4242, no_salt=True)
+        self.hashchain.encrypt("Olá, mundo!", pass_=[50, 25, 60], seed=4242, no_salt=True)
+        self.assertEqual(self.hashchain._info, expected.as_info())
+        self.assertEqual(self.hashchain.decrypt(retonar=True), "Olá, mundo!")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+"""Testes da descriptografia incremental (StreamDecryptor)."""
+import io
+import unittest
+
+from hashchain.core import Decryption, Encryption
+from hashchain.core.stream_decryption import StreamDecryptor
+
+from test_key_legacy import legacy_key
+from test_key_v2 import counted, cycle_key
+
+
+def salted_stream_key(segments, salt_l):
+    """Chave v2 com salt derivado da seed (salt_flag 2), sem posições inválidas."""
+    cl = segments * 20 + salt_l * 999
+    return "H22" + counted(salt_l) + "020999" + cycle_key(segments, [20], [], cl)[3:]
+
+
+def decrypt_in_chunks(ciphertext, key, size):
+    """Descriptografa o ciphertext entregue em partes de size caracteres."""
+    decryptor = StreamDecryptor(key)
+    parts = [decryptor.feed(ciphertext[i:i + size]) for i in range(0, len(ciphertext), size)]
+    parts.append(decryptor.finalize())
+    return "".join(parts)
+
+
+class TestStreamDecryptor(unittest.TestCase):
+    """StreamDecryptor produz o mesmo resultado de Decryption.decrypt."""
+    
+    def test_matches_decrypt(self):
+        for plaintext in ("Mensagem secreta!", "ñabc€d olá\n" * 40):
+            for compress_text in (True, False):
+                for no_salt in (True, False):
+                    ciphertext, key, _ = Encryption().encrypt(
+                        plaintext, pass_=[50, 25, 60], seed=4242, no_salt=no_salt,
+                        compress_text=compress_text,
+                    )
+                    expected = Decryption().decrypt(ciphertext, key)[0]
+                    
+                    for size in (1, 7, len(ciphertext)):
+                        with self.subTest(compress_text=compress_text, no_salt=no_salt, size=size):
+                            self.assertEqual(decrypt_in_chunks(ciphertext, key, size), expected)
+    
+    def test_legacy_salted_key(self):
+        ciphertext, key = legacy_key("Mensagem secreta, um pouco maior!", no_salt=False)
+        
+        for size in (1, 9):
+            with self.subTest(size=size):
+                self.assertEqual(
+                    decrypt_in_chunks(ciphertext, key, size), "Mensagem secreta, um pouco maior!"
+                )
+    
+    def test_decrypt_stream_writes_plaintext(self):
+        ciphertext, key, _ = Encryption().encrypt("abc" * 100, pass_=[30], seed=7, no_salt=True)
+        destination = io.StringIO()
+        
+        written = StreamDecryptor(key).decrypt_stream(io.StringIO(ciphertext), destination, block_size=16)
+        
+        self.assertEqual(destination.getvalue(), "abc" * 100)
+        self.assertEqual(written, 300)
+    
+    def test_huge_declared_length_does_not_expand_passes(self):
+        # Sem o ciphertext, o comprimento declarado não é limitado na leitura da chave
+        decryptor = StreamDecryptor(cycle_key(10 ** 12, [20, 30], [5], 25 * 10 ** 12))
+        
+        self.assertEqual(set(decryptor._tables), {20, 30})
+        with self.assertRaisesRegex(ValueError, "menor que o comprimento"):
+            decryptor.finalize()
+    
+    
+    def test_oversized_salted_key_is_rejected_before_drawing_salt(self):
+        key = salted_stream_key(10 ** 6, 10 ** 6)
+        
+        with self.assertRaisesRegex(ValueError, "quantidade de salt acima do limite"):
+            StreamDecryptor(key, max_salted_segments=1 << 17)
+        with self.assertRaisesRegex(ValueError, "mensagem com salt acima do limite"):
+            StreamDecryptor(salted_stream_key(1 << 17, 20), max_salted_segments=1 << 17)
+    
+    def test_declared_lengths_above_limit_are_rejected(self):
+        with self.assertRaisesRegex(ValueError, "comprimento do texto acima do limite"):
+            StreamDecryptor(cycle_key(10 ** 12, [20], [], 20 * 10 ** 12), max_length=1 << 33)
+        with self.assertRaisesRegex(ValueError, "comprimento declarado acima do limite"):
+            StreamDecryptor(cycle_key(100, [20], [], 10 ** 12), max_length=1 << 33)
+    
+    def test_key_within_limits_still_decrypts(self):
+        ciphertext, key, _ = Encryption().encrypt("abc" * 50, pass_=[30, 45], seed=3)
+        decryptor = StreamDecryptor(key, max_length=1 << 33, max_salted_segments=1 << 17)
+        
+        self.assertEqual(decryptor.feed(ciphertext) + decryptor.finalize(), "abc" * 50)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+"""Testes da criptografia incremental (StreamEncryptor)."""
+import unittest
+
+from hashchain.core import Decryption, Encryption
+from hashchain.core.stream_encryption import StreamEncryptor
+
+
+def encrypt_in_chunks(plaintext, size, **kwargs):
+    """Criptografa o texto entregue em partes de size caracteres."""
+    encryptor = StreamEncryptor(**kwargs)
+    parts = [encryptor.feed(plaintext[i:i + size]) for i in range(0, len(plaintext), size)]
+    tail, key = encryptor.finalize()
+    return "".join(parts) + tail, key
+
+
+class TestStreamEncryptor(unittest.TestCase):
+    """A saída em partes é idêntica a Encryption.encrypt(no_salt=True)."""
+    
+    def test_matches_encrypt(self):
+        for plaintext in ("Mensagem secreta!", "ñabc€d olá\n" * 40):
+            for compress_text in (True, False):
+                expected = Encryption().encrypt(
+                    plaintext, pass_=[50, 25, 60], seed=4242, no_salt=True,
+                    compress_text=compress_text,
+                )
+                for size in (1, 7, len(plaintext)):
+                    with self.subTest(compress_text=compress_text, size=size):
+                        ciphertext, key = encrypt_in_chunks(
+                            plaintext, size, pass_=[50, 25, 60], seed=4242,
+                            compress_text=compress_text,
+                        )
+                        self.assertEqual((ciphertext, key), expected[:2])
+    
+    def test_auto_passes_round_trip(self):
+        ciphertext, key = encrypt_in_chunks("Olá, mundo! " * 10, 5, seed=777)
+        self.assertEqual(Decryption().decrypt(ciphertext, key)[0], "Olá, mundo! " * 10)
+    
+    def test_iter_encrypt(self):
+        encryptor = StreamEncryptor(pass_=[30, 45], seed=31)
+        ciphertext = "".join(encryptor.iter_encrypt(["linha 1\n", "", "linha 2"]))
+        self.assertEqual(Decryption().decrypt(ciphertext, encryptor.key)[0], "linha 1linha 2")
+    
+    def test_finalize_twice_or_without_text(self):
+        with self.assertRaises(ValueError):
+            StreamEncryptor(seed=1).finalize()
+        
+        encryptor = StreamEncryptor(pass_=[30], seed=1)
+        encryptor.feed("abc")
+        encryptor.finalize()
+        with self.assertRaises(ValueError):
+            encryptor.finalize()
+        with self.assertRaises(ValueError):
+            encryptor.feed("d")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+"""Testes do cache LRU de tabelas (TableCache)."""
+import unittest
+
+from hashchain.tables import TableCache, TableGenerator
+
+
+def entry_size(seed, size):
+    """Tamanho estimado de uma entrada, como o cache calcula."""
+    tables, inverted = TableGenerator(seed).generate_tables([size])
+    return TableCache._estimate_size(tables[size], inverted[size])
+
+
+class TestTableCache(unittest.TestCase):
+    """Eviction LRU, limite de bytes, contadores e tabelas somente leitura."""
+    
+    def test_same_tables_as_generator(self):
+        cache = TableCache()
+        table, inverted = cache.get(1000050, 50)
+        tables, inverted_tables = TableGenerator(1000050).generate_tables([50])
+        self.assertEqual(dict(table), tables[50])
+        self.assertEqual(dict(inverted), inverted_tables[50])
+    
+    def test_counters(self):
+        cache = TableCache()
+        first = cache.get(1, 30)
+        second = cache.get(1, 30)
+        cache.get(2, 30)
+        
+        self.assertIs(first[0], second[0])
+        self.assertEqual(
+            {k: cache.stats()[k] for k in ("hits", "misses", "evictions", "entries")},
+            {"hits": 1, "misses": 2, "evictions": 0, "entries": 2},
+        )
+        
+        cache.clear()
+        self.assertEqual(cache.stats()["hits"], 0)
+        self.assertEqual(len(cache), 0)
+    
+    def test_evicts_least_recently_used(self):
+        # Três entradas do mesmo tamanho em um orçamento que comporta apenas duas
+        cache = TableCache(max_bytes=2 * entry_size(1, 30) + entry_size(1, 30) // 2)
+        cache.get(1, 30)
+        cache.get(2, 30)
+        cache.get(1, 30)  # 1 passa a ser a mais recente
+        cache.get(3, 30)  # remove 2
+        
+        self.assertEqual(cache.stats()["evictions"], 1)
+        hits = cache.hits
+        cache.get(1, 30)
+        cache.get(3, 30)
+        self.assertEqual(cache.hits, hits + 2)
+        cache.get(2, 30)
+        self.assertEqual(cache.misses, 4)
+    
+    def test_byte_limit(self):
+        size = entry_size(1, 30)
+        cache = TableCache(max_bytes=3 * size)
+        for seed in range(1, 11):
+            cache.get(seed, 30)
+            self.assertLessEqual(cache.stats()["bytes"], cache.max_bytes)
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(cache.evictions, 7)
+    
+    def test_entry_larger_than_budget_is_not_stored(self):
+        cache = TableCache(max_bytes=10)
+        table, _ = cache.get(1, 30)
+        self.assertTrue(table)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats()["bytes"], 0)
+    
+    def test_negative_budget_is_rejected(self):
+        with self.assertRaises(ValueError):
+            TableCache(max_bytes=-1)
+    
+    def test_tables_are_read_only(self):
+        cache = TableCache()
+        table, inverted = cache.get(1, 30)
+        character = next(iter(table))
+        with self.assertRaises(TypeError):
+            table[character] = "0" * 30
+        with self.assertRaises(TypeError):
+            del inverted[next(iter(inverted))]
+        self.assertEqual(cache.get(1, 30)[0], table)
+
+
+if __name__ == "__main__":
+    unittest.main()
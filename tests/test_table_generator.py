@@ -0,0 +1,45 @@
+"""Testes do TableGenerator (backends Python e NumPy)."""
+import unittest
+from unittest import mock
+
+from hashchain.tables import TableGenerator
+from hashchain.tables.table_generator import NUMPY_AVAILABLE
+
+# Seeds de passe como as de Encryption (seed * 1000000 + passe), inclusive negativas
+SEEDS = (1, 4242 * 1000000 + 50, -987654321, 10 ** 63 * 1000000 + 999)
+SIZES = [1, 7, 8, 20, 64, 65, 999]
+
+
+class TestTableGenerator(unittest.TestCase):
+    """Tabelas determinísticas e iguais entre os backends."""
+    
+    @unittest.skipUnless(NUMPY_AVAILABLE, "NumPy não instalado")
+    def test_numpy_matches_pure_python(self):
+        for seed in SEEDS:
+            with self.subTest(seed=seed):
+                expected = TableGenerator(seed, use_numpy=False).generate_tables(SIZES)
+                self.assertEqual(TableGenerator(seed, use_numpy=True).generate_tables(SIZES), expected)
+    
+    def test_generate_cipher_matches_table(self):
+        characters = ["a", "b", "a", "ç"]  # "a" repetido: vale a última ocorrência
+        for seed in SEEDS:
+            generator = TableGenerator(seed, characters, use_numpy=False)
+            tables, _ = generator.generate_tables(SIZES)
+            for size in SIZES:
+                for char in characters:
+                    with self.subTest(seed=seed, size=size, char=char):
+                        self.assertEqual(generator.generate_cipher(char, size), tables[size][char])
+    
+    def test_inverted_tables(self):
+        tables, inverted = TableGenerator(SEEDS[1]).generate_tables([50])
+        self.assertEqual({v: k for k, v in tables[50].items()}, inverted[50])
+    
+    def test_numpy_requested_without_numpy(self):
+        with mock.patch("hashchain.tables.table_generator.NUMPY_AVAILABLE", False):
+            with self.assertRaises(ValueError):
+                TableGenerator(1, use_numpy=True)
+            self.assertFalse(TableGenerator(1).use_numpy)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,328 @@
+"""Testes da API web (cliente de testes do Flask)."""
+import importlib
+import os
+import sys
+import time
+import types
+import unittest
+from concurrent.futures import Future
+
+try:
+    import flask  # noqa: F401
+    FLASK_AVAILABLE = True
+except ImportError:
+    FLASK_AVAILABLE = False
+
+from hashchain.core import Decryption, Encryption
+
+
+def load_web_module(name):
+    """
+    Importa um módulo de hashchain.interfaces.web sem carregar a GUI.
+    
+    hashchain.interfaces importa a interface gráfica (customtkinter), que não é
+    necessária para a API; os pacotes são registrados vazios antes do import.
+    """
+    interfaces = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                              'hashchain', 'interfaces')
+    for package_name, path in (('hashchain.interfaces', interfaces),
+                               ('hashchain.interfaces.web', os.path.join(interfaces, 'web'))):
+        if package_name not in sys.modules:
+            package = types.ModuleType(package_name)
+            package.__path__ = [path]
+            sys.modules[package_name] = package
+    return importlib.import_module(f'hashchain.interfaces.web.{name}')
+
+
+def load_web_app():
+    """Importa hashchain.interfaces.web.app sem carregar a GUI."""
+    return load_web_module('app')
+
+
+class InlinePool:
+    """Substituto do pool de processos que executa o job na hora, no próprio processo."""
+    
+    def submit(self, fn, *args):
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+    
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
+
+
+class HeldPool(InlinePool):
+    """Substituto do pool cujos jobs só terminam quando o teste resolve o Future."""
+    
+    def __init__(self):
+        self.futures = []
+    
+    def submit(self, fn, *args):
+        future = Future()
+        self.futures.append(future)
+        return future
+
+
+def multipart_parts(response):
+    """Separa as partes de uma resposta multipart/mixed em {name: corpo}, na ordem recebida."""
+    boundary = response.mimetype_params['boundary']
+    body = response.get_data(as_text=True)
+    parts = {}
+    for chunk in body.split(f'--{boundary}')[1:-1]:
+        headers, content = chunk.strip('\r\n').split('\r\n\r\n', 1)
+        name = headers.split('name="', 1)[1].split('"', 1)[0]
+        parts[name] = content
+    return parts
+
+
+class WebTestCase(unittest.TestCase):
+    """Cliente de testes do Flask; os ajustes em app.config são desfeitos ao final."""
+    
+    def setUp(self):
+        self.web = load_web_app()
+        self.client = self.web.app.test_client()
+    
+    def configure(self, **values):
+        """Altera app.config apenas durante o teste."""
+        config = self.web.app.config
+        for name, value in values.items():
+            if name in config:
+                self.addCleanup(config.__setitem__, name, config[name])
+            else:
+                self.addCleanup(config.pop, name)
+            config[name] = value
+
+
+@unittest.skipUnless(FLASK_AVAILABLE, 'Flask não instalado')
+class TestBatchEndpoints(WebTestCase):
+    """Endpoints /api/encrypt/batch e /api/decrypt/batch."""
+    
+    def test_round_trip_with_item_errors(self):
+        response = self.client.post('/api/encrypt/batch', json={
+            'seed': 17,
+            'passes': [50, 25],
+            'items': [
+                {'plaintext': 'primeiro'},
+                {'plaintext': 123},
+                {'plaintext': 'segundo', 'seed': '99', 'passes': '30 40'},
+                {'plaintext': 'terceiro', 'no_salt': 'false'},
+                {'plaintext': 'quarto', 'no_salt': True},
+            ],
+        })
+        self.assertEqual(response.status_code, 200)
+        encrypted = response.get_json()['results']
+        self.assertEqual([('error' in result) for result in encrypted], [False, True, False, True, False])
+        
+        response = self.client.post('/api/decrypt/batch', json={'items': [
+            {'ciphertext': encrypted[0]['ciphertext'], 'key': encrypted[0]['key']},
+            {'ciphertext': encrypted[2]['ciphertext']},
+            {'ciphertext': encrypted[2]['ciphertext'], 'key': encrypted[2]['key']},
+            {'ciphertext': encrypted[4]['ciphertext'], 'key': 'H2x'},
+            {'ciphertext': encrypted[4]['ciphertext'], 'key': encrypted[4]['key']},
+        ]})
+        self.assertEqual(response.status_code, 200)
+        decrypted = response.get_json()['results']
+        self.assertEqual(decrypted[0], {'plaintext': 'primeiro'})
+        self.assertEqual(decrypted[1], {'error': 'Chave não fornecida'})
+        self.assertEqual(decrypted[2], {'plaintext': 'segundo'})
+        self.assertIn('Chave inválida', decrypted[3]['error'])
+        self.assertEqual(decrypted[4], {'plaintext': 'quarto'})
+    
+    def test_rejected_batches(self):
+        self.configure(BATCH_MAX_ITEMS=2, BATCH_MAX_TOTAL_LENGTH=10)
+        cases = [
+            ({'items': []}, 400),
+            ({'items': 'texto'}, 400),
+            ({'items': [{'plaintext': 'a'}], 'no_salt': 'false'}, 400),
+            ({'items': [{'plaintext': 'a'}], 'seed': 'x'}, 400),
+            ({'items': [{'plaintext': 'a'}] * 3}, 413),
+            ({'items': [{'plaintext': 'a' * 6}, {'plaintext': 'b' * 6}]}, 413),
+        ]
+        for body, status in cases:
+            with self.subTest(body=body):
+                self.assertEqual(self.client.post('/api/encrypt/batch', json=body).status_code, status)
+    
+    def test_item_above_length_limit(self):
+        self.configure(BATCH_MAX_ITEM_LENGTH=5)
+        response = self.client.post('/api/encrypt/batch', json={
+            'items': [{'plaintext': 'abcdef'}, {'plaintext': 'abc'}],
+        })
+        results = response.get_json()['results']
+        self.assertIn('excede o limite', results[0]['error'])
+        self.assertIn('key', results[1])
+
+
+class TestJobManager(unittest.TestCase):
+    """Fila de jobs: limite de pendentes e expiração, sem criar processos."""
+    
+    def setUp(self):
+        self.jobs = load_web_module('jobs')
+    
+    def make_manager(self, pool, **kwargs):
+        manager = self.jobs.JobManager(**kwargs)
+        manager._pool = pool
+        return manager
+    
+    def test_round_trip(self):
+        manager = self.make_manager(InlinePool())
+        job_id = manager.submit('encrypt', {'plaintext': 'Olá, jobs!', 'seed': 7, 'pass_': [40]})
+        encrypted = manager.status(job_id)
+        self.assertEqual(encrypted['status'], 'done')
+        
+        job_id = manager.submit('decrypt', {
+            'ciphertext': encrypted['result']['ciphertext'],
+            'key': encrypted['result']['key'],
+        })
+        self.assertEqual(manager.status(job_id)['result'], {'plaintext': 'Olá, jobs!'})
+    
+    def test_job_error(self):
+        manager = self.make_manager(InlinePool())
+        job_id = manager.submit('decrypt', {'ciphertext': '0101', 'key': 'H2x'})
+        info = manager.status(job_id)
+        self.assertEqual(info['status'], 'error')
+        self.assertIn('Chave inválida', info['error'])
+    
+    def test_max_pending(self):
+        pool = HeldPool()
+        manager = self.make_manager(pool, max_pending=2)
+        first = manager.submit('encrypt', {'plaintext': 'a'})
+        second = manager.submit('encrypt', {'plaintext': 'b'})
+        self.assertEqual(manager.status(first)['status'], 'queued')
+        self.assertEqual(manager.status(second)['queue_position'], 1)
+        with self.assertRaises(self.jobs.JobQueueFullError):
+            manager.submit('encrypt', {'plaintext': 'c'})
+        
+        pool.futures[0].set_result({})
+        self.assertEqual(manager.status(first)['status'], 'done')
+        self.assertEqual(manager.status(second)['queue_position'], 0)
+        manager.submit('encrypt', {'plaintext': 'c'})
+    
+    def test_finished_jobs_expire(self):
+        pool = HeldPool()
+        manager = self.make_manager(pool, ttl=60)
+        finished = manager.submit('encrypt', {'plaintext': 'a'})
+        pending = manager.submit('encrypt', {'plaintext': 'b'})
+        pool.futures[0].set_result({})
+        
+        info = manager.status(finished)
+        self.assertEqual(info['expires_at'], info['finished_at'] + 60)
+        manager._jobs[finished].finished_at = time.time() - 61
+        manager._jobs[pending].created_at = time.time() - 61
+        
+        self.assertIsNone(manager.status(finished))
+        self.assertEqual(manager.status(pending)['status'], 'queued')
+    
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            self.jobs.JobManager(max_pending=0)
+        with self.assertRaises(ValueError):
+            self.make_manager(InlinePool()).submit('compress', {})
+
+
+@unittest.skipUnless(FLASK_AVAILABLE, 'Flask não instalado')
+class TestJobEndpoints(WebTestCase):
+    """Endpoints /api/jobs e /api/jobs/<job_id>."""
+    
+    def use_manager(self, pool, **kwargs):
+        manager = self.web.JobManager(**kwargs)
+        manager._pool = pool
+        self.addCleanup(setattr, self.web, '_job_manager', self.web._job_manager)
+        self.web._job_manager = manager
+        return manager
+    
+    def test_round_trip(self):
+        self.use_manager(InlinePool())
+        response = self.client.post('/api/jobs', json={
+            'type': 'encrypt', 'plaintext': 'Olá, jobs!', 'seed': '7', 'passes': '40 60',
+        })
+        self.assertEqual(response.status_code, 202)
+        encrypted = self.client.get(f"/api/jobs/{response.get_json()['job_id']}").get_json()
+        self.assertEqual(encrypted['status'], 'done')
+        
+        response = self.client.post('/api/jobs', json={
+            'type': 'decrypt',
+            'ciphertext': encrypted['result']['ciphertext'],
+            'key': encrypted['result']['key'],
+        })
+        decrypted = self.client.get(f"/api/jobs/{response.get_json()['job_id']}").get_json()
+        self.assertEqual(decrypted['result'], {'plaintext': 'Olá, jobs!'})
+    
+    def test_queue_full(self):
+        self.use_manager(HeldPool(), max_pending=1)
+        self.assertEqual(self.client.post('/api/jobs', json={'plaintext': 'a'}).status_code, 202)
+        response = self.client.post('/api/jobs', json={'plaintext': 'b'})
+        self.assertEqual(response.status_code, 503)
+        self.assertIn('Fila de jobs cheia', response.get_json()['error'])
+    
+    def test_rejected_requests(self):
+        self.use_manager(InlinePool())
+        cases = [
+            ({'type': 'compress', 'plaintext': 'a'}, 400),
+            ({'plaintext': ''}, 400),
+            ({'plaintext': 'a', 'no_salt': 'false'}, 400),
+            ({'type': 'decrypt', 'ciphertext': '0101'}, 400),
+        ]
+        for body, status in cases:
+            with self.subTest(body=body):
+                self.assertEqual(self.client.post('/api/jobs', json=body).status_code, status)
+        self.assertEqual(self.client.get('/api/jobs/desconhecido').status_code, 404)
+
+
+@unittest.skipUnless(FLASK_AVAILABLE, 'Flask não instalado')
+class TestStreamEndpoints(WebTestCase):
+    """Endpoints /api/encrypt/stream e /api/decrypt/stream."""
+    
+    def test_encrypt_key_is_last_part(self):
+        plaintext = 'Olá, stream! ñ€\n' * 5000  # maior que STREAM_BLOCK_SIZE, com caracteres de vários bytes
+        self.assertGreater(len(plaintext.encode('utf-8')), self.web.STREAM_BLOCK_SIZE)
+        response = self.client.post(
+            '/api/encrypt/stream?seed=7&passes=50+25', data=plaintext.encode('utf-8'),
+            content_type='text/plain; charset=utf-8',
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'multipart/mixed')
+        
+        parts = multipart_parts(response)
+        self.assertEqual(list(parts), ['ciphertext', 'key'])
+        expected = Encryption().encrypt(plaintext, pass_=[50, 25], seed=7, no_salt=True)
+        self.assertEqual((parts['ciphertext'], parts['key']), expected[:2])
+        
+        response = self.client.post(
+            '/api/decrypt/stream', data=parts['ciphertext'], content_type='text/plain',
+            headers={self.web.KEY_HEADER: parts['key']},
+        )
+        self.assertEqual(response.get_data(as_text=True), Decryption().decrypt(*expected[:2])[0])
+    
+    def test_encrypt_rejected_requests(self):
+        cases = [
+            ('/api/encrypt/stream', 'abc', 'application/json', 415),
+            ('/api/encrypt/stream', '', 'text/plain', 400),
+            ('/api/encrypt/stream?seed=x', 'abc', 'text/plain', 400),
+            ('/api/encrypt/stream', b'\xff\xfe', 'text/plain; charset=utf-8', 400),
+            ('/api/encrypt/stream', 'abc', 'text/plain; charset=desconhecido', 400),
+        ]
+        for url, data, content_type, status in cases:
+            with self.subTest(url=url, content_type=content_type):
+                response = self.client.post(url, data=data, content_type=content_type)
+                self.assertEqual(response.status_code, status)
+    
+    def test_decrypt_key_in_first_line(self):
+        ciphertext, key, _ = Encryption().encrypt("Olá, stream!", pass_=[50, 25], seed=7, no_salt=True)
+        response = self.client.post(
+            '/api/decrypt/stream', data=f'{key}\n{ciphertext}', content_type='text/plain'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_data(as_text=True), "Olá, stream!")
+    
+    def test_key_line_above_limit(self):
+        self.configure(STREAM_MAX_KEY_LENGTH=64)
+        response = self.client.post('/api/decrypt/stream', data='1' * 100000, content_type='text/plain')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('Chave maior que o limite', response.get_json()['error'])
+
+
+if __name__ == '__main__':
+    unittest.main()